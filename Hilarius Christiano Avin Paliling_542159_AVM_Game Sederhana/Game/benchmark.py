@@ -0,0 +1,199 @@
+"""Benchmark gameplay tanpa window (SDL dummy driver).
+
+Contoh: python Game/benchmark.py --mobs 500 --projectiles 50 --frames 600
+        python Game/benchmark.py --replay Game/recordings/session-xxx.input
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+sys.path.append(str(Path(__file__).parent))
+# Path asset di game relatif ke folder project ("Game/assets/...")
+os.chdir(Path(__file__).parent.parent)
+
+import pygame
+from main import Game
+from settings import DIRTY_RECT_MAX_RATIO
+from src.systems.dirty_renderer import DirtyRectRenderer
+from src.systems.input_log import InputReplay
+
+PHASES = ('update', 'collision', 'draw', 'flip')
+MOVE_KEYS = (pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w)
+
+
+class ScriptedKeys:
+    """Pengganti pygame.key.get_pressed() untuk input yang sudah ditentukan"""
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class Scenario:
+    """Skenario benchmark: jumlah mob dan projectile dijaga tetap setiap frame"""
+    def __init__(self, game, mobs, projectiles, rotation=0):
+        self.game = game
+        self.mobs = mobs
+        self.projectiles = projectiles
+        self.frame = 0
+        game.player.rotation_angle = rotation
+        # Spawn otomatis dimatikan supaya jumlah entitas sesuai skenario
+        game.spawn_cooldown = float('inf')
+        game.spawn_interval = float('inf')
+        game.get_input = self.get_input
+
+    def get_input(self):
+        # Jalan memutar (kanan, bawah, kiri, atas) sambil terus menembak
+        move = MOVE_KEYS[(self.frame // 60) % len(MOVE_KEYS)]
+        return ScriptedKeys([move]), True
+
+    def prepare_frame(self):
+        """Isi ulang mob/projectile yang mati, tidak ikut dihitung waktunya"""
+        game = self.game
+        game.player.hp = game.player.max_hp
+        while len(game.mobs) < self.mobs:
+            x, y = game.get_random_walkable_pos()
+            game.mobs.spawn(x, y, game.difficulty)
+        pool = game.player.projectiles
+        while len(pool) < self.projectiles:
+            angle = game.rng.uniform(0, 2 * np.pi)
+            direction = (np.cos(angle), np.sin(angle))
+            if not pool.spawn(game.player.pos, direction, game.player.projectile_speed,
+                              game.player.projectile_radius, 60):
+                break
+        self.frame += 1
+
+
+def timed(method, timings, phase):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings[phase] += time.perf_counter() - start
+    return wrapper
+
+
+def run_benchmark(mobs, projectiles, frames, warmup=30, seed=0, rotation=0, dirty=False):
+    """Jalankan skenario dan kembalikan array waktu (detik) per fase, shape (frames, len(PHASES))"""
+    game = Game(headless=True, seed=seed)
+    if dirty:
+        game.dirty_renderer = DirtyRectRenderer(game.screen_width, game.screen_height, DIRTY_RECT_MAX_RATIO)
+    game.change_state('play')
+    scenario = Scenario(game, mobs, projectiles, rotation)
+
+    frame_timings = {'collision': 0.0}
+    game.handle_projectile_hits = timed(game.handle_projectile_hits, frame_timings, 'collision')
+    game.handle_player_contacts = timed(game.handle_player_contacts, frame_timings, 'collision')
+
+    results = np.zeros((frames, len(PHASES)))
+    for i in range(warmup + frames):
+        scenario.prepare_frame()
+        frame_timings['collision'] = 0.0
+
+        t0 = time.perf_counter()
+        game.begin_sim_step()
+        game.update_gameplay()
+        t1 = time.perf_counter()
+        game.current_state.draw(game.screen)
+        t2 = time.perf_counter()
+        game.present()
+        t3 = time.perf_counter()
+
+        if i >= warmup:
+            collision = frame_timings['collision']
+            results[i - warmup] = (t1 - t0 - collision, collision, t2 - t1, t3 - t2)
+    return results
+
+
+def state_digest(game):
+    """Hash state gameplay akhir, sama persis jika simulasi berjalan identik"""
+    digest = hashlib.sha1()
+    count = len(game.mobs)
+    for array in (game.player.pos, game.mobs.pos[:count], game.mobs.hp[:count]):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    digest.update(repr((game.player.hp, game.score, game.difficulty, game.sim_time)).encode())
+    return digest.hexdigest()
+
+
+def run_replay(path, dirty=False):
+    """Putar ulang log input tick demi tick (satu draw per tick).
+
+    Return (array waktu per fase seperti run_benchmark, digest state akhir).
+    """
+    replay = InputReplay(path)
+    game = Game(headless=True)
+    game.input_replay = replay
+    if dirty:
+        game.dirty_renderer = DirtyRectRenderer(game.screen_width, game.screen_height, DIRTY_RECT_MAX_RATIO)
+    game.change_state('play')
+    play_state = game.current_state
+
+    frame_timings = {'collision': 0.0}
+    game.handle_projectile_hits = timed(game.handle_projectile_hits, frame_timings, 'collision')
+    game.handle_player_contacts = timed(game.handle_player_contacts, frame_timings, 'collision')
+
+    results = []
+    # Berhenti saat log habis atau player mati (tick itu juga tidak membaca input saat direkam)
+    while not replay.finished and game.current_state is play_state and not game.game_over:
+        frame_timings['collision'] = 0.0
+        t0 = time.perf_counter()
+        game.begin_sim_step()
+        game.current_state.update()
+        t1 = time.perf_counter()
+        game.current_state.draw(game.screen)
+        t2 = time.perf_counter()
+        game.present()
+        t3 = time.perf_counter()
+        collision = frame_timings['collision']
+        results.append((t1 - t0 - collision, collision, t2 - t1, t3 - t2))
+    return np.array(results).reshape(-1, len(PHASES)), state_digest(game)
+
+
+def print_report(results, scenario):
+    print(f"Scenario: {scenario}, {len(results)} frames")
+    print(f"{'phase':<10}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}   (ms)")
+    ms = results * 1000
+    for i, phase in enumerate(PHASES):
+        col = ms[:, i]
+        print(f"{phase:<10}{col.mean():>10.3f}{np.percentile(col, 50):>10.3f}"
+              f"{np.percentile(col, 95):>10.3f}{col.max():>10.3f}")
+    total = ms.sum(axis=1)
+    print(f"{'total':<10}{total.mean():>10.3f}{np.percentile(total, 50):>10.3f}"
+          f"{np.percentile(total, 95):>10.3f}{total.max():>10.3f}")
+    print(f"~{1000 / total.mean():.1f} FPS")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless gameplay benchmark")
+    parser.add_argument('--mobs', type=int, default=100, help="jumlah mob yang dijaga tetap")
+    parser.add_argument('--projectiles', type=int, default=20, help="jumlah projectile yang dijaga tetap")
+    parser.add_argument('--frames', type=int, default=300, help="jumlah frame yang diukur")
+    parser.add_argument('--warmup', type=int, default=30, help="frame awal yang tidak diukur")
+    parser.add_argument('--seed', type=int, default=0, help="seed RNG gameplay")
+    parser.add_argument('--rotation', type=int, default=0, help="sudut rotasi player (derajat)")
+    parser.add_argument('--dirty', action='store_true', help="pakai dirty rect renderer")
+    parser.add_argument('--replay', help="putar ulang log input rekaman (INPUT_RECORD_ENABLED)")
+    args = parser.parse_args()
+
+    if args.replay:
+        results, digest = run_replay(args.replay, dirty=args.dirty)
+        print_report(results, f"replay {args.replay}")
+        print(f"state digest {digest}")
+    else:
+        results = run_benchmark(args.mobs, args.projectiles, args.frames, warmup=args.warmup,
+                                seed=args.seed, rotation=args.rotation, dirty=args.dirty)
+        print_report(results, f"{args.mobs} mobs, {args.projectiles} projectiles")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Suite benchmark hot path (micro) dan skenario gameplay penuh (macro), hasil ke JSON.
+
+Contoh: python Game/benchmark_suite.py --output baseline.json
+        python Game/benchmark_suite.py --baseline baseline.json --only collision
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+sys.path.append(str(Path(__file__).parent))
+# Path --output/--baseline relatif ke folder tempat script dijalankan
+INVOCATION_DIR = Path.cwd()
+# Path asset di game relatif ke folder project ("Game/assets/...")
+os.chdir(Path(__file__).parent.parent)
+
+import pygame
+from main import Game
+from benchmark import PHASES, Scenario, run_benchmark
+from src.states.credits_state import CreditsState
+
+MACRO_MOBS = (10, 100, 1000)
+CREDITS_EFFECTS = ("zoom", "pan", "fade", "pixelate", "wave")
+
+# name -> fungsi(samples) yang mengembalikan array waktu (detik) per sample
+MICRO_CASES = {}
+
+
+def micro(name):
+    def register(case):
+        MICRO_CASES[name] = case
+        return case
+    return register
+
+
+def measure(step, samples, prepare=None, warmup=10):
+    """Waktu step() per sample; prepare() dipanggil sebelum tiap sample dan tidak ikut dihitung"""
+    times = np.zeros(samples)
+    for i in range(warmup + samples):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times[i - warmup] = elapsed
+    return times
+
+
+def play_game(mobs, projectiles, rotation=0, seed=0):
+    """Game baru di play state dengan jumlah entitas dijaga tetap oleh Scenario"""
+    game = Game(headless=True, seed=seed)
+    game.change_state('play')
+    scenario = Scenario(game, mobs, projectiles, rotation)
+    scenario.prepare_frame()
+    return game, scenario
+
+
+def sim_prepare(game, scenario):
+    """Isi ulang entitas dan simpan posisi tick sebelumnya, seperti awal satu tick"""
+    def prepare():
+        scenario.prepare_frame()
+        game.begin_sim_step()
+    return prepare
+
+
+@micro('is_walkable_x1000')
+def bench_is_walkable(samples):
+    game, _ = play_game(0, 0)
+    points = [game.get_random_walkable_pos() for _ in range(1000)]
+    is_walkable = game.is_walkable
+
+    def step():
+        for x, y in points:
+            is_walkable(x, y)
+    return measure(step, samples)
+
+
+@micro('is_walkable_many_10k')
+def bench_is_walkable_many(samples):
+    game, _ = play_game(0, 0)
+    xs = game.rng.uniform(0, game.bg_width, 10000)
+    ys = game.rng.uniform(0, game.bg_height, 10000)
+    return measure(lambda: game.is_walkable_many(xs, ys), samples)
+
+
+@micro('mob_update_1000')
+def bench_mob_update(samples):
+    game, scenario = play_game(1000, 0)
+    game.flow_field.set_target(*game.player.pos)
+    return measure(game.mobs.update, samples, sim_prepare(game, scenario))
+
+
+@micro('update_projectiles_200')
+def bench_update_projectiles(samples):
+    game, scenario = play_game(0, 200)
+    return measure(game.player.update_projectiles, samples, sim_prepare(game, scenario))
+
+
+@micro('collision_1000')
+def bench_collision(samples):
+    game, scenario = play_game(1000, 100)
+
+    def step():
+        game.handle_projectile_hits()
+        game.handle_player_contacts()
+    return measure(step, samples, sim_prepare(game, scenario))
+
+
+@micro('render_entities_1000_rotated')
+def bench_render_entities(samples):
+    # Player dan mob berputar (dan flip) tiap sample supaya jalur rotasi/flip transform cache
+    # yang terukur, bukan sprite polos
+    game, scenario = play_game(1000, 0, rotation=45)
+    queue = game.render_queue
+    game.camera.center_on(game.player.pos)
+    offset = game.camera.offset
+    player, mobs = game.player, game.mobs
+    sample = itertools.count()
+
+    def prepare():
+        scenario.prepare_frame()
+        flips = next(sample)
+        player.rotation_angle = (player.rotation_angle + 7) % 360
+        player.flip_horizontal = bool(flips & 1)
+        player.flip_vertical = bool(flips & 2)
+        # Sama seperti awal MobSwarm.update (tidak dipanggil di benchmark ini)
+        mobs.rotation_angle = player.rotation_angle
+        mobs.flip_horizontal = player.flip_horizontal
+        mobs.flip_vertical = player.flip_vertical
+
+    def step():
+        queue.clear()
+        game.player.submit(queue, offset)
+        game.mobs.submit(queue, offset, 1.0)
+        queue.flush(game.screen)
+    return measure(step, samples, prepare)
+
+
+@micro('draw_gameplay_1000')
+def bench_draw_gameplay(samples):
+    game, scenario = play_game(1000, 20)
+    return measure(lambda: game.draw_gameplay(game.screen), samples, scenario.prepare_frame)
+
+
+def credits_case(effect):
+    def bench_credits(samples):
+        game = Game(headless=True)
+        state = CreditsState(game)
+        state.animation_type = effect
+        if effect == "wave":
+            state.setup_wave()
+
+        def step():
+            state.update()
+            state.draw(game.screen)
+        return measure(step, samples)
+    return bench_credits
+
+
+for _effect in CREDITS_EFFECTS:
+    micro(f'credits_{_effect}')(credits_case(_effect))
+
+
+def summarize(times):
+    ms = np.asarray(times) * 1000
+    return {
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'min_ms': float(ms.min()),
+        'samples': int(len(ms)),
+    }
+
+
+def run_suite(samples, frames, only=None, seed=0):
+    results = {}
+    for name, case in MICRO_CASES.items():
+        if only and only not in name:
+            continue
+        print(f"  {name} ...", flush=True)
+        results[name] = summarize(case(samples))
+
+    for mobs in MACRO_MOBS:
+        name = f'scenario_{mobs}_mobs'
+        if only and only not in name:
+            continue
+        print(f"  {name} ...", flush=True)
+        phases = run_benchmark(mobs, 20, frames, seed=seed)
+        result = summarize(phases.sum(axis=1))
+        result['phases_p50_ms'] = {phase: float(np.percentile(phases[:, i] * 1000, 50))
+                                   for i, phase in enumerate(PHASES)}
+        results[name] = result
+    return results
+
+
+def environment():
+    return {
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Bandingkan p50 dengan baseline, return daftar nama yang melambat melebihi threshold"""
+    regressions = []
+    print(f"{'benchmark':<30}{'base p50':>10}{'now p50':>10}{'change':>9}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<30}{'-':>10}{result['p50_ms']:>10.3f}{'new':>9}")
+            continue
+        before, after = base['p50_ms'], result['p50_ms']
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > threshold and after - before > min_delta_ms
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<30}{before:>10.3f}{after:>10.3f}{change * 100:>8.1f}%{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def print_results(results):
+    print(f"{'benchmark':<30}{'mean':>10}{'p50':>10}{'p95':>10}{'min':>10}   (ms)")
+    for name, result in results.items():
+        print(f"{name:<30}{result['mean_ms']:>10.3f}{result['p50_ms']:>10.3f}"
+              f"{result['p95_ms']:>10.3f}{result['min_ms']:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite benchmark micro/macro untuk hot path game")
+    parser.add_argument('--samples', type=int, default=200, help="jumlah sample per micro benchmark")
+    parser.add_argument('--frames', type=int, default=300, help="jumlah frame per skenario macro")
+    parser.add_argument('--seed', type=int, default=0, help="seed RNG gameplay skenario macro")
+    parser.add_argument('--only', help="hanya jalankan benchmark yang namanya mengandung teks ini")
+    parser.add_argument('--output', help="simpan hasil ke file JSON (bisa dipakai sebagai baseline)")
+    parser.add_argument('--baseline', help="file JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="p50 lebih lambat dari rasio ini dianggap regresi (0.15 = 15%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05,
+                        help="selisih p50 minimum (ms) agar dianggap regresi, meredam noise")
+    args = parser.parse_args()
+
+    print("Running benchmarks:")
+    results = run_suite(args.samples, args.frames, only=args.only, seed=args.seed)
+    print_results(results)
+
+    if args.output:
+        output = INVOCATION_DIR / args.output
+        report = {'environment': environment(), 'samples': args.samples, 'frames': args.frames,
+                  'results': results}
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {output}")
+
+    regressions = []
+    if args.baseline:
+        with open(INVOCATION_DIR / args.baseline) as f:
+            baseline = json.load(f)['results']
+        print(f"\nCompared with {args.baseline}:")
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    pygame.quit()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
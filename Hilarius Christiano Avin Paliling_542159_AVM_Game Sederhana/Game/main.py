@@ -1,8 +1,9 @@
 import pygame
 import numpy as np
+import os
 import sys
+import threading
 from pathlib import Path
-import math
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, FPS
 
 pygame.init()
@@ -11,18 +12,43 @@ pygame.init()
 sys.path.append(str(Path(__file__).parent))
 from settings import *
 from src.entities.player import Player
-from src.entities.mob import Mob
+from src.entities.mob import MobSwarm
 from src.systems.camera import Camera
+from src.systems.tile_world import TileWorld
+from src.systems.render_queue import RenderQueue
+from src.systems.flow_field import FlowField
+from src.systems.walkability import WalkabilityGrid
+from src.systems.spawn_sampler import SpawnSampler
+from src.systems.spatial_hash import SpatialHash
+from src.systems.dirty_renderer import DirtyRectRenderer
+from src.systems.frame_profiler import FrameProfiler
+from src.systems.input_log import InputRecorder
+from src.systems.text_cache import text_cache
+from src.systems.sprite_cache import sprite_cache
+from src.systems.font_registry import font_registry
+from src.systems.asset_cache import asset_cache
+from src.utils.vectors import lerp_wrapped
 from src.states.menu_state import MenuState
 from src.states.play_state import PlayState
 from src.states.pause_state import PauseState
 from src.states.gameover_state import GameOverState
 from src.states.credits_state import CreditsState
 from src.states.tutorial_state import TutorialState
+from src.states.state_registry import StateRegistry
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None):
+        self.headless = headless
+        self.seed = seed
+        if headless:
+            # Tanpa window: pakai video driver dummy dari SDL
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            pygame.display.quit()
         pygame.init()
+        font_registry.warm_async(PRELOAD_FONTS)
+        # RNG gameplay (spawn dll), bisa di-seed agar hasil simulasi bisa diulang
+        self.rng = np.random.default_rng(seed)
         # Store screen dimensions from settings as instance attributes
         self.settings = {
             'game_title': TITLE,  # From your settings import
@@ -38,54 +64,89 @@ class Game:
         
         self.clock = pygame.time.Clock()
         self.running = True
+        self.render_alpha = 1.0  # posisi render di antara tick sebelumnya (0) dan sekarang (1)
+        self.dirty_renderer = None
+        if DIRTY_RECT_RENDERING:
+            self.dirty_renderer = DirtyRectRenderer(self.screen_width, self.screen_height, DIRTY_RECT_MAX_RATIO)
+        self.render_queue = RenderQueue(self.screen_width, self.screen_height)
+        self.profiler = FrameProfiler()
+        # Rekam/putar ulang input gameplay (InputRecorder / InputReplay), None = input langsung
+        self.input_recorder = None
+        self.input_replay = None
         self.scale_factor = 1.0  # Faktor skala default
         self.min_scale = 0.5    # Skala minimum
         self.max_scale = 2.0     # Skala maksimum
 
-        # State system
-        self.states = {
-        'menu': MenuState(self),
-        'play': PlayState(self),
-        'pause': PauseState(self),
-        'gameover': GameOverState(self),
-        'credits': CreditsState(self),
-        'tutorial': TutorialState(self)
-        }
-        self.current_state = self.states['menu']
-        self.current_state.enter()
-
-        # Data gameplay (reset di PlayState.enter)
-        self.reset_game()
+        # Asset gameplay (background, grid walkable) baru di-load saat dibutuhkan
+        self.gameplay_assets_loaded = False
+        self.assets_lock = threading.Lock()
+        # Data gameplay (dibuat di PlayState.enter lewat reset_game)
+        self.score = 0
+        self.high_score = 0
 
         # Font untuk UI
-        self.font = pygame.font.SysFont('Arial', 24)
-        self.game_over_font = pygame.font.Font(None, 72)
-        self.instruction_font = pygame.font.Font(None, 36)
-
-        # Load background asli (3840x2160)
-        self.bg = pygame.image.load("Game/assets/bg/bg.png").convert()
-        # Skala background ke ukuran window
-        self.bg_scaled = pygame.transform.smoothscale(self.bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.bg_width = self.bg_scaled.get_width()
-        self.bg_height = self.bg_scaled.get_height()
-        self.bg_mask = pygame.image.load("Game/assets/bg/bg_mask.png").convert()
-        self.bg_mask = pygame.transform.smoothscale(self.bg_mask, (self.bg_width, self.bg_height))
-        
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.font = font_registry.get('Arial', 24)
+        self.game_over_font = font_registry.get(None, 72)
+        self.instruction_font = font_registry.get(None, 36)
+        # Panel score disusun ulang hanya jika nilai yang tampil berubah
+        self.hud_panel = pygame.Surface((200, 200), pygame.SRCALPHA)
+        self.hud_values = None
+        self.gameover_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.gameover_overlay.fill((0, 0, 0, 180))
+
+        self.last_spawn_time = 0
         self.spawn_cooldown = MOB_SPAWN_COOLDOWN
         self.difficulty = 1.0
         self.wave = 0
         self.wave_timer = 0
         self.wave_duration = 30000  # 30 detik per wave
-        
+
+        # State system: tiap state baru dibuat saat pertama kali dimasuki
+        self.states = StateRegistry(self, {
+            'menu': MenuState,
+            'play': PlayState,
+            'pause': PauseState,
+            'gameover': GameOverState,
+            'credits': CreditsState,
+            'tutorial': TutorialState,
+        })
+        self.current_state = self.states['menu']
+        self.current_state.enter()
+        self.prefetch_next_states('menu')
+
+    def load_gameplay_assets(self):
+        """Load background dan grid walkable sekali saja (aman dipanggil dari thread prefetch)"""
+        with self.assets_lock:
+            if self.gameplay_assets_loaded:
+                return
+            # Background dunia (3840x2160) dipotong jadi tile di asset cache,
+            # saat main hanya tile di sekitar kamera yang di-load
+            mask_path = "Game/assets/bg/bg_mask.png"
+            self.world = TileWorld("Game/assets/bg/bg.png")
+            self.bg_width = self.world.width
+            self.bg_height = self.world.height
+            world_size = (self.bg_width, self.bg_height)
+            # Bake mask sekali ke grid boolean, surface mask tidak perlu disimpan
+            self.walk_grid = WalkabilityGrid(asset_cache.cached_array(
+                'walk_grid', [mask_path], world_size,
+                lambda: WalkabilityGrid.from_surface(self.load_scaled_image(mask_path, world_size)).grid))
+            self.mob_grid = SpatialHash(COLLISION_CELL_SIZE, self.bg_width, self.bg_height)
+            # Flow field pathfinding mob, grid kasar dari walk grid yang sama
+            self.flow_field = FlowField(self.walk_grid)
+            # Index pixel walkable untuk spawn (selalu dapat posisi, waktu terbatas)
+            self.spawn_sampler = SpawnSampler(self.walk_grid)
+            self.gameplay_assets_loaded = True
+
+    def load_scaled_image(self, path, size):
+        """Decode PNG lalu smoothscale, gambar ukuran penuh langsung dilepas"""
+        return pygame.transform.smoothscale(pygame.image.load(path).convert(), size)
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
-                self.scale_factor = min(self.scale_factor + 0.1, self.max_scale)
-                self.apply_scale_to_entities()
+                self.change_zoom(1)
             elif event.key == pygame.K_MINUS:
-                self.scale_factor = max(self.scale_factor - 0.1, self.min_scale)
-                self.apply_scale_to_entities()
+                self.change_zoom(-1)
             # Add these to ensure immediate response
             elif event.key == pygame.K_q:
                 self.player.rotation_angle = (self.player.rotation_angle - self.player.rotation_speed) % 360
@@ -96,25 +157,53 @@ class Game:
             elif event.key == pygame.K_v:
                 self.player.flip_vertical = not self.player.flip_vertical
     
-    def apply_scale_to_entities(self):
-        """Terapkan skala ke semua entitas"""
-        self.player.apply_scale(self.scale_factor)
-        for mob in self.mobs:
-            mob.apply_scale(self.scale_factor)
-            
+    def change_zoom(self, steps):
+        """Geser zoom sekian ZOOM_STEP, dibulatkan ke grid supaya ukuran sprite cocok dengan piramida"""
+        scale = round(self.scale_factor + steps * ZOOM_STEP, 6)
+        self.scale_factor = min(max(scale, self.min_scale), self.max_scale)
+        self.apply_scale_to_entities()
+
+    def zoom_index(self):
+        """Posisi scale_factor di zoom_levels()"""
+        return int(round((self.scale_factor - self.min_scale) / ZOOM_STEP))
+
+    def zoom_levels(self):
+        """Semua nilai scale_factor yang bisa dicapai dengan +/-"""
+        count = int(round((self.max_scale - self.min_scale) / ZOOM_STEP))
+        return [round(self.min_scale + i * ZOOM_STEP, 6) for i in range(count + 1)]
+
     def change_state(self, state_name):
         self.current_state.exit()
         self.current_state = self.states[state_name]
         self.current_state.enter()
+        self.prefetch_next_states(state_name)
+
+    def prefetch_next_states(self, state_name):
+        if STATE_PREFETCH_ENABLED and not self.headless:
+            self.states.prefetch(STATE_PREFETCH_NEXT.get(state_name, ()))
 
     def reset_game(self):
+        self.load_gameplay_assets()
+        self.start_session_rng()
+        self.flow_field.reset()
         self.game_over = False
-        self.player = Player(np.array([SCREEN_WIDTH//2, SCREEN_HEIGHT//2]), self)
-        self.mobs = [Mob(100, 100, self.player, self)]
-        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.camera.set_target(self.player)
+        self.player = Player(np.array([self.bg_width//2, self.bg_height//2]), self)
+        self.mobs = MobSwarm(self)
+        # Mob pertama juga lewat spawn sampler, (100, 100) belum tentu walkable
+        first_spawn = self.spawn_sampler.sample_annulus(self.rng, self.player.pos[0], self.player.pos[1],
+                                                        MOB_SPAWN_MIN_DISTANCE, MOB_SPAWN_MAX_DISTANCE)
+        if first_spawn is not None:
+            self.mobs.spawn(*first_spawn)
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, self.bg_width, self.bg_height)
+        self.last_camera_offset = None
         self.spawn_timer = 0
         self.spawn_interval = 120
+        # Waktu simulasi (ms), maju SIM_DT per tick dan berhenti saat pause
+        self.sim_time = 0
+        self.last_spawn_time = 0
+        self.wave_timer = 0
+        self.wave = 0
+        self.spawn_cooldown = MOB_SPAWN_COOLDOWN
         self.difficulty = 1.0
         self.score = 0
         self.high_score = 0
@@ -124,9 +213,25 @@ class Game:
         
         self.game_over = False
         self.scale_factor = 1.0  # Reset scale factor
-        self.player = Player(np.array([SCREEN_WIDTH//2, SCREEN_HEIGHT//2]), self)
+        self.player = Player(np.array([self.bg_width//2, self.bg_height//2]), self)
+        self.camera.set_target(self.player)
+        if SPRITE_PYRAMID_PREWARM and not self.headless:
+            self.player.prewarm_scales(self.zoom_levels())
         
 
+    def start_session_rng(self):
+        """Seed RNG baru tiap sesi gameplay supaya sesi bisa diulang dari log input"""
+        if self.input_recorder is not None:
+            self.input_recorder.close()
+            self.input_recorder = None
+        if self.input_replay is not None:
+            self.session_seed = self.input_replay.seed
+        else:
+            self.session_seed = int(self.rng.integers(2**63))
+            if INPUT_RECORD_ENABLED:
+                self.input_recorder = InputRecorder.start_new(self.session_seed)
+        self.rng = np.random.default_rng(self.session_seed)
+
     def load_high_score(self):
         try:
             with open('highscore.txt', 'r') as f:
@@ -142,28 +247,72 @@ class Game:
     def apply_scale_to_entities(self):
         """Terapkan skala ke semua entitas"""
         self.player.apply_scale(self.scale_factor)
-        for mob in self.mobs:
-            mob.apply_scale(1.0, self.difficulty)  # Gunakan scale 1.0 dan kirim difficulty
+        self.mobs.apply_scale(1.0, self.difficulty)  # Gunakan scale 1.0 dan kirim difficulty
 
     def run(self):
+        accumulator = 0.0
+        profiler = self.profiler
         while self.running:
-            self.clock.tick(FPS)
+            # Simulasi maju dengan dt tetap, render mengikuti FPS
+            frame_ms = self.clock.tick(FPS)
+            accumulator += frame_ms / 1000
+            profiler.begin_frame(frame_ms)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                self.handle_debug_event(event)
                 self.current_state.handle_event(event)
-            self.current_state.update()
+            profiler.lap(profiler.EVENTS)
+
+            steps = 0
+            while accumulator >= SIM_DT and steps < MAX_SIM_STEPS:
+                self.begin_sim_step()
+                self.current_state.update()
+                accumulator -= SIM_DT
+                steps += 1
+            if steps == MAX_SIM_STEPS:
+                # Terlalu tertinggal: buang sisa waktu daripada spiral of death
+                accumulator = min(accumulator, SIM_DT)
+
+            profiler.lap(profiler.UPDATE)
+
+            self.render_alpha = accumulator / SIM_DT
             self.current_state.draw(self.screen)
-            pygame.display.flip()
+            overlay = profiler.draw_overlay(self.screen)
+            if overlay is not None and self.dirty_renderer is not None:
+                self.dirty_renderer.add([overlay])
+            profiler.lap(profiler.DRAW)
+            self.present()
+            profiler.lap(profiler.FLIP)
+            if profiler.enabled:
+                profiler.end_frame(self.profile_counts())
         self.save_high_score()
+        if self.input_recorder is not None:
+            self.input_recorder.close()
+        self.shutdown()
         pygame.quit()
         sys.exit()
+
+    def shutdown(self):
+        """Hentikan thread background yang masih memakai pygame, sebelum pygame.quit"""
+        self.states.shutdown()
+        sprite_cache.shutdown()
+        font_registry.shutdown()
+        if self.profiler.enabled:
+            # Biaya startup tiap state yang sempat dibuat (init + preload asset)
+            for name, phases in self.states.report().items():
+                print(f"State {name}: " + ", ".join(f"{phase} {ms:.1f} ms" for phase, ms in phases.items()))
             
     def update_gameplay(self):
         if self.game_over:
             return self.handle_game_over()
 
-        current_time = pygame.time.get_ticks()
+        self.sim_time += SIM_DT * 1000
+        current_time = self.sim_time
+
+        # Dapatkan input keyboard dan mouse (di awal tick: replay menerapkan zoom rekaman di sini,
+        # sama seperti event +/- yang diproses sebelum tick)
+        keys, attack_pressed = self.get_input()
         
         # Sistem wave
         if current_time - self.wave_timer > self.wave_duration:
@@ -178,55 +327,38 @@ class Game:
             # Sesuaikan cooldown untuk spawn berikutnya
             self.spawn_cooldown = max(500, MOB_SPAWN_COOLDOWN - (self.wave * 100))
 
-        # Dapatkan input keyboard
-        keys = pygame.key.get_pressed()
-
         # Update player dengan input
         self.player.update(keys)
 
+        # Flow field dihitung ulang (bertahap) hanya jika player pindah cell
+        self.flow_field.set_target(self.player.pos[0], self.player.pos[1])
+        self.flow_field.step()
+
         # Update kamera
         self.camera.update()
 
         # Handle serangan
-        if pygame.mouse.get_pressed()[0]:
+        if attack_pressed:
             self.player.attack()
 
         # Update projectile
         self.player.update_projectiles()
 
         # Cek tabrakan projectile dengan mob
-        projectiles_to_remove = []
-        mobs_to_remove = []
-
-        for proj_idx, proj in enumerate(self.player.projectiles):
-            for mob_idx, mob in enumerate(self.mobs):
-                if self.check_collision(proj['pos'], proj['radius'], mob.pos, mob.radius):
-                    if mob.take_damage(self.player.damage):
-                        mobs_to_remove.append(mob_idx)
-                    projectiles_to_remove.append(proj_idx)
-                    break
-
-        # Hapus projectile dan mob yang kena
-        for idx in sorted(projectiles_to_remove, reverse=True):
-            if idx < len(self.player.projectiles):
-                self.player.projectiles.pop(idx)
-
-        for idx in sorted(mobs_to_remove, reverse=True):
-            if idx < len(self.mobs):
-                self.mobs.pop(idx)
-                self.score += self.kill_score * self.difficulty
-
-        # Update mob dan cek tabrakan dengan player
-        for mob in self.mobs:
-            mob.update()
-            if self.check_collision(self.player.pos, 15, mob.pos, mob.radius):
-                if self.player.take_damage(10):
-                    self.game_over = True
-                    self.save_high_score()
+        profiler = self.profiler
+        profiler.lap(profiler.UPDATE)
+        self.handle_projectile_hits()
+        profiler.lap(profiler.COLLISION)
+
+        # Update semua mob sekaligus dan cek tabrakan dengan player
+        self.mobs.update()
+        profiler.lap(profiler.UPDATE)
+        self.handle_player_contacts()
+        profiler.lap(profiler.COLLISION)
 
         # Sistem spawn mob
         self.spawn_timer += 1
-        if self.spawn_timer >= self.spawn_interval / self.difficulty and len(self.mobs) < 20:
+        if self.spawn_timer >= self.spawn_interval / self.difficulty and len(self.mobs) < MAX_SWARM_MOBS:
             self.spawn_mob()
             self.spawn_timer = 0
             self.difficulty += 0.05
@@ -234,12 +366,91 @@ class Game:
 
         return False
 
+    def handle_debug_event(self, event):
+        """F3 = tampil/sembunyikan overlay profiler, F4 = simpan isi ring buffer ke CSV"""
+        if event.type != pygame.KEYDOWN or not self.profiler.enabled:
+            return
+        if event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+        elif event.key == pygame.K_F4:
+            print(f"Profiler: {self.profiler.dump_csv()}")
+
+    def profile_counts(self):
+        """Jumlah entitas untuk profiler, urutan sesuai FrameProfiler.COUNTERS"""
+        mobs = getattr(self, 'mobs', None)
+        player = getattr(self, 'player', None)
+        world = getattr(self, 'world', None)
+        queue = self.render_queue.stats()
+        return (
+            len(mobs) if mobs is not None else 0,
+            len(player.projectiles) if player is not None else 0,
+            queue['drawn'],
+            queue['culled'],
+            world.stats()['resident'] if world is not None else 0,
+        )
+
+    def begin_sim_step(self):
+        """Simpan posisi entitas sebelum tick untuk interpolasi render"""
+        player = getattr(self, 'player', None)
+        if player is None:
+            return  # Belum ada sesi gameplay (masih di menu/tutorial/credits)
+        player.prev_pos[:] = player.pos
+        player.projectiles.begin_step()
+        self.mobs.begin_step()
+
+    def present(self):
+        """Tampilkan frame ke layar (dirty rect jika aktif, selain itu flip penuh)"""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
+
+    def get_input(self):
+        """Input untuk satu tick gameplay: (keys, tombol serang ditekan)"""
+        if self.input_replay is not None:
+            keys, attack, zoom_index = self.input_replay.next_input()
+            if zoom_index != self.zoom_index():
+                self.change_zoom(zoom_index - self.zoom_index())
+            return keys, attack
+        keys, attack = pygame.key.get_pressed(), pygame.mouse.get_pressed()[0]
+        if self.input_recorder is not None:
+            self.input_recorder.record(keys, attack, self.zoom_index())
+        return keys, attack
+
+    def handle_projectile_hits(self):
+        """Broad phase spatial hash + jarak kuadrat untuk projectile vs mob"""
+        projectiles = self.player.projectiles
+        n_proj = len(projectiles)
+        n_mobs = len(self.mobs)
+        self.mob_grid.build(self.mobs.pos[:n_mobs])
+        proj_idx, mob_idx = self.mob_grid.overlapping_pairs(
+            projectiles.pos[:n_proj], projectiles.radius[:n_proj], self.mobs.radius[:n_mobs])
+
+        if len(proj_idx):
+            # Setiap projectile hanya mengenai satu mob (index terkecil)
+            order = np.lexsort((mob_idx, proj_idx))
+            proj_idx, first = np.unique(proj_idx[order], return_index=True)
+            mob_idx = mob_idx[order][first]
+            dead = self.mobs.take_damage(mob_idx, self.player.damage)
+            mobs_to_remove = np.unique(mob_idx[dead])
+
+            # Hapus projectile dan mob yang kena
+            projectiles.kill(proj_idx)
+            projectiles.compact()
+            self.mobs.remove(mobs_to_remove)
+            self.score += self.kill_score * self.difficulty * len(mobs_to_remove)
+
+    def handle_player_contacts(self):
+        """Mob yang menyentuh player memberi damage"""
+        self.mob_grid.build(self.mobs.pos[:len(self.mobs)])
+        _, touching = self.mob_grid.overlapping_pairs(
+            self.player.pos[None, :], 15, self.mobs.radius[:len(self.mobs)])
+        if len(touching) and self.player.take_damage(10 * len(touching)):
+            self.game_over = True
+            self.save_high_score()
+
     def get_random_walkable_pos(self):
-        while True:
-            x = np.random.uniform(0, self.bg_width)
-            y = np.random.uniform(0, self.bg_height)
-            if self.is_walkable(x, y):
-                return x, y
+        return self.spawn_sampler.sample(self.rng)
     
     def start_new_wave(self):
         self.wave += 1
@@ -250,94 +461,109 @@ class Game:
         self.spawn_cooldown = max(1000, MOB_SPAWN_COOLDOWN - (self.wave * 50))  # Minimal 1 detik
         
     def spawn_mob(self):
-        # Tentukan posisi spawn di sekitar player (tidak terlalu dekat)
-        spawn_distance = np.random.uniform(200, 400)
-        angle = np.random.uniform(0, 2 * math.pi)
-        
-        # Hitung posisi spawn relatif terhadap player
-        spawn_x = self.player.pos[0] + spawn_distance * math.cos(angle)
-        spawn_y = self.player.pos[1] + spawn_distance * math.sin(angle)
-        
-        # Pastikan posisi dalam batas layar dan walkable
-        spawn_x = max(0, min(spawn_x, self.bg_width - 1))
-        spawn_y = max(0, min(spawn_y, self.bg_height - 1))
-        
-        if self.is_walkable(spawn_x, spawn_y):
-            new_mob = Mob(spawn_x, spawn_y, self.player, self)
-            # Terapkan difficulty saat scaling
-            new_mob.apply_scale(1.0, self.difficulty)  # Kirim difficulty sebagai parameter
-            self.mobs.append(new_mob)
+        # Posisi spawn walkable di sekitar player (tidak terlalu dekat), selalu berhasil
+        spawn = self.spawn_sampler.sample_annulus(self.rng, self.player.pos[0], self.player.pos[1],
+                                                  MOB_SPAWN_MIN_DISTANCE, MOB_SPAWN_MAX_DISTANCE)
+        if spawn is not None:
+            spawn_x, spawn_y = spawn
+            # Difficulty langsung diterapkan ke HP, speed dan damage mob baru
+            self.mobs.spawn(spawn_x, spawn_y, self.difficulty)
             
             # Tingkatkan kesulitan sedikit setiap spawn
             self.difficulty += MOB_SPAWN_INCREASE_RATE
             self.score += 10 * self.difficulty
 
-    def check_collision(self, pos1, radius1, pos2, radius2):
-        distance = np.linalg.norm(pos1 - pos2)
-        return distance < (radius1 + radius2)
-
     def handle_game_over(self):
         keys = pygame.key.get_pressed()
         if keys[pygame.K_r]:
-            self.__init__()
+            self.__init__(headless=self.headless, seed=self.seed)
             return True
         return False
 
-    def draw_gameplay(self, surface):
-        # Kamera mengikuti player secara horizontal (atau bisa fixed)
-        offset = np.array([0, 0])  # Tidak perlu offset_x
+    def draw_gameplay(self, surface, track_dirty=False):
+        # Kamera mengikuti posisi player hasil interpolasi
+        alpha = self.render_alpha
+        player_pos = lerp_wrapped(self.player.prev_pos, self.player.pos, alpha, self.bg_width)
+        self.camera.center_on(player_pos)
+        offset = self.camera.offset
+        self.world.stream(offset, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = self.dirty_renderer if track_dirty else None
+
+        # Gambar tile background (dirty rect: hanya area yang digambar frame sebelumnya)
+        if renderer is not None:
+            if self.last_camera_offset is None:
+                renderer.invalidate()
+            else:
+                # Kamera bergeser: geser frame lama, cukup gambar ulang strip tepi + rect entitas
+                dx, dy = (offset - self.last_camera_offset).astype(int)
+                renderer.scroll(surface, dx, dy)
+            self.last_camera_offset = offset.copy()
+            renderer.restore_background(lambda area: self.world.draw(surface, offset, area))
+        else:
+            self.world.draw(surface, offset)
+
+        # Projectile di bawah semua sprite
+        dirty = self.player.draw_projectiles(surface, offset, alpha)
+        # Player dan mob lewat render queue: di-cull, di-sort y, lalu satu Surface.blits
+        # (player digambar di posisi interpolasi dengan menggeser offset-nya)
+        player_offset = offset + (player_pos - self.player.pos)
+        queue = self.render_queue
+        queue.clear()
+        self.player.submit(queue, player_offset)
+        self.mobs.submit(queue, offset, alpha)
+        dirty += queue.flush(surface)
+        dirty += self.player.draw_health_bar(surface, player_offset)
 
-        # Gambar background hanya sekali
-        surface.blit(self.bg_scaled, (0, 0))
+        # Panel score (tetap)
+        dirty.append(surface.blit(self.get_hud_panel(), (10, 10)))
 
-        # Gambar projectile, player, mobs
-        self.player.draw_projectiles(surface, offset)
-        self.player.draw(surface, offset)
-        for mob in self.mobs:
-            mob.draw(surface, offset)
+        if renderer is not None:
+            renderer.add(dirty)
 
-        # Panel score (tetap)
-        score_surface = pygame.Surface((200, 200), pygame.SRCALPHA)
+    def get_hud_panel(self):
+        hud_values = (int(self.score), int(self.high_score), f"{self.difficulty:.1f}")
+        if hud_values == self.hud_values:
+            return self.hud_panel
+        self.hud_values = hud_values
+        score, high_score, difficulty = hud_values
+
+        score_surface = self.hud_panel
+        score_surface.fill((0, 0, 0, 0))
         pygame.draw.rect(score_surface, (0, 0, 0, 128), (0, 0, 200, 80), border_radius=5)
-        score_text = self.font.render(f"SCORE: {int(self.score)}", True, (255, 255, 0))
-        high_score_text = self.font.render(f"HIGH: {int(self.high_score)}", True, (255, 215, 0))
-        diff_text = self.font.render(f"DIFFICULTY: {self.difficulty:.1f}x", True, WHITE)
+        score_text = text_cache.render(self.font, f"SCORE: {score}", True, (255, 255, 0))
+        high_score_text = text_cache.render(self.font, f"HIGH: {high_score}", True, (255, 215, 0))
+        diff_text = text_cache.render(self.font, f"DIFFICULTY: {difficulty}x", True, WHITE)
         score_surface.blit(score_text, (10, 10))
         score_surface.blit(high_score_text, (10, 35))
         score_surface.blit(diff_text, (10, 60))
-        surface.blit(score_surface, (10, 10))
+        return score_surface
 
     def draw_gameover(self, surface):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.gameover_overlay, (0, 0))
 
-        game_over_text = self.game_over_font.render("GAME OVER", True, (255, 50, 50))
+        game_over_text = text_cache.render(self.game_over_font, "GAME OVER", True, (255, 50, 50))
         text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
         surface.blit(game_over_text, text_rect)
 
-        score_text = self.instruction_font.render(f"Final Score: {int(self.score)}", True, (255, 255, 255))
+        score_text = text_cache.render(self.instruction_font, f"Final Score: {int(self.score)}", True, (255, 255, 255))
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
         surface.blit(score_text, score_rect)
 
         if self.score >= self.high_score:
-            hs_text = self.instruction_font.render("NEW HIGH SCORE!", True, (255, 215, 0))
+            hs_text = text_cache.render(self.instruction_font, "NEW HIGH SCORE!", True, (255, 215, 0))
             hs_rect = hs_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60))
             surface.blit(hs_text, hs_rect)
 
-        retry_text = self.instruction_font.render("Press R to Retry", True, (200, 200, 255))
+        retry_text = text_cache.render(self.instruction_font, "Press R to Retry", True, (200, 200, 255))
         retry_rect = retry_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 100))
         surface.blit(retry_text, retry_rect)
 
     def is_walkable(self, x, y):
-        xi = int(x)
-        yi = int(y)
-        if 0 <= xi < self.bg_width and 0 <= yi < self.bg_height:
-            color = self.bg_mask.get_at((xi, yi))
-            # Field merah: R tinggi, G & B rendah (misal R > 200, G < 80, B < 80)
-            if color.r > 200 and color.g < 80 and color.b < 80:
-                return True
-        return False
+        # Field merah: R tinggi, G & B rendah (sudah di-bake di WalkabilityGrid)
+        return self.walk_grid.is_walkable(x, y)
+
+    def is_walkable_many(self, xs, ys):
+        return self.walk_grid.is_walkable_many(xs, ys)
 
 if __name__ == "__main__":
     game = Game()
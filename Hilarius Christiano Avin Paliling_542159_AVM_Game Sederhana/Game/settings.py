@@ -4,13 +4,37 @@ from pathlib import Path
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 TITLE = "Survival Hardcore Matrix Edition"
-FPS = 60
+FPS = 60  # batas frame render
+
+# Simulation (fixed timestep, tidak tergantung FPS render)
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ
+MAX_SIM_STEPS = 5  # batas langkah catch-up per frame render
+
+# Font yang di-load di background saat startup (family, size, bold), None = font default
+PRELOAD_FONTS = [
+    ('Arial', 20, False), ('Arial', 24, False), ('Arial', 28, False), ('Arial', 32, False),
+    ('Arial', 48, False), ('Arial', 48, True),
+    (None, 20, False), (None, 36, False), (None, 42, False), (None, 48, False),
+    (None, 72, False), (None, 80, False),
+]
+
+# State yang di-prefetch di background setelah masuk ke sebuah state
+STATE_PREFETCH_ENABLED = True
+STATE_PREFETCH_NEXT = {
+    'menu': ('play', 'tutorial', 'credits'),
+    'play': ('pause', 'gameover'),
+}
 
 # Paths
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets"
 SPRITES_DIR = ASSETS_DIR / "sprites"
 
+# Cache turunan asset (background ter-scale, grid walkable, frame sprite) di disk
+ASSET_CACHE_ENABLED = True
+ASSET_CACHE_DIR = BASE_DIR / ".asset_cache"
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -18,13 +42,68 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
+# World: bg.png resolusi penuh dipotong jadi tile dan di-stream mengikuti kamera
+WORLD_SCALE = 1.0  # ukuran dunia relatif terhadap resolusi asli bg.png (3840x2160)
+WORLD_TILE_SIZE = 256
+WORLD_TILE_PREFETCH_MARGIN = 1  # jumlah tile di luar layar yang di-load lebih awal
+WORLD_TILE_KEEP_MARGIN = 3  # tile lebih jauh dari ini (dalam tile) dilepas dari memori
+WORLD_TILE_LOADS_PER_FRAME = 4  # batas load tile prefetch per frame
+
+# Zoom (+/-)
+ZOOM_STEP = 0.1
+SPRITE_PYRAMID_PREWARM = True  # scale frame semua level zoom di background saat game dimulai
+
 # Physics
 GRAVITY = 0.5
 
 # Debug
 DEBUG_MODE = True
+# Profiler fase frame (F3 = overlay, F4 = dump CSV), biayanya hampir nol jika disabled
+PROFILER_ENABLED = DEBUG_MODE
+PROFILER_HISTORY = 600  # jumlah frame terakhir yang disimpan di ring buffer
+PROFILER_OVERLAY_REFRESH = 10  # panel overlay disusun ulang tiap sekian frame
+PROFILER_DUMP_DIR = BASE_DIR / "profiles"
+# Rekam input tiap tick + seed RNG per sesi, bisa diputar ulang dengan benchmark.py --replay
+INPUT_RECORD_ENABLED = False
+INPUT_RECORD_DIR = BASE_DIR / "recordings"
 
 # Spawn
 MOB_SPAWN_COOLDOWN = 5000  # dalam milidetik (5 detik)
 MAX_MOBS = 5  # jumlah maksimum mob yang bisa ada di layar
-MOB_SPAWN_INCREASE_RATE = 0.05  # Peningkatan kesulitan per spawn
\ No newline at end of file
+MOB_SPAWN_INCREASE_RATE = 0.05  # Peningkatan kesulitan per spawn
+MAX_SWARM_MOBS = 2000  # batas total mob dari spawn timer
+MOB_SWARM_CAPACITY = MAX_SWARM_MOBS  # slot mob yang di-alokasi di awal (pool), bertambah otomatis jika penuh
+MOB_SPAWN_MIN_DISTANCE = 200  # mob muncul di annulus [min, max] di sekitar player
+MOB_SPAWN_MAX_DISTANCE = 400
+SPAWN_CELL_SIZE = 64  # ukuran cell index pixel walkable untuk spawn
+SPAWN_ANNULUS_TRIES = 8  # percobaan acak sebelum cek semua pixel di cell kandidat
+
+# Pathfinding mob (flow field BFS dari cell player)
+FLOW_FIELD_CELL_SIZE = 32  # ukuran cell grid kasar (pixel)
+FLOW_FIELD_WALKABLE_RATIO = 0.5  # cell walkable jika minimal rasio pixel ini walkable
+FLOW_FIELD_STEPS_PER_TICK = 16  # gelombang BFS per tick saat player pindah cell
+FLOW_FIELD_DIRECT_RANGE = 64  # lebih dekat dari ini mob langsung menuju player
+
+# Steering antar mob (separation + cohesion lewat spatial hash)
+MOB_NEIGHBOR_RADIUS = 32  # jangkauan cari tetangga (<= COLLISION_CELL_SIZE supaya cukup 3x3 cell)
+MOB_MAX_NEIGHBORS_PER_CELL = 4  # batas tetangga yang dicek per cell, biaya tetap linear
+MOB_SEPARATION_RADIUS = 24  # tetangga lebih dekat dari ini saling mendorong
+MOB_SEPARATION_WEIGHT = 1.5
+MOB_COHESION_WEIGHT = 0.2
+
+# Projectile
+PROJECTILE_POOL_CAPACITY = 512  # jumlah maksimum projectile aktif
+
+# Collision
+COLLISION_CELL_SIZE = 32  # ukuran cell spatial hash (>= radius mob + radius projectile)
+
+# Render cache
+TRANSFORM_CACHE_BUDGET = 32 * 1024 * 1024  # batas memori frame hasil rotate/flip (byte)
+TRANSFORM_CACHE_ANGLE_STEP = 1  # sudut rotasi dibulatkan ke kelipatan ini (derajat)
+TEXT_CACHE_SIZE = 256  # jumlah maksimum teks hasil render yang disimpan
+CREDITS_EFFECT_FRAMES = 24  # jumlah frame efek zoom/pixelate credits yang di-cache
+
+# Dirty rect rendering (untuk mesin lemah), fallback ke flip penuh jika area kotor terlalu besar.
+# Saat kamera bergeser frame lama di-scroll, hanya strip tepi + rect entitas yang digambar ulang
+DIRTY_RECT_RENDERING = False
+DIRTY_RECT_MAX_RATIO = 0.5  # rasio area layar maksimum sebelum fallback
\ No newline at end of file
@@ -1,173 +1,312 @@
 import numpy as np
 import pygame
 from settings import *
-from src.utils.vectors import *
-from pygame.sprite import Sprite
-import math
-
-class Mob(Sprite):
-    def __init__(self, x, y, target, game):
-        self.pos = np.array([x, y], dtype='float64')
-        self.target = target
+from src.systems.sprite_cache import sprite_cache
+from src.systems.transform_cache import transform_cache
+from src.utils.vectors import lerp_wrapped, wrap_near
+
+MOB_SPRITE_PATHS = {
+    "walkR": "Game/assets/sprites/Mob/WalkR.png",
+    "walkL": "Game/assets/sprites/Mob/WalkL.png",
+    "attackR": "Game/assets/sprites/Mob/AttackR.png",
+    "attackL": "Game/assets/sprites/Mob/AttackL.png",
+}
+
+class MobSwarm:
+    """Semua mob disimpan sebagai array NumPy (structure-of-arrays) dan diupdate sekaligus.
+
+    Array sekaligus menjadi pool: slot [0, count) berisi mob hidup, [count, capacity) slot bebas.
+    Mob mati dibebaskan lewat swap-remove dan slotnya dipakai ulang oleh spawn berikutnya,
+    jadi setelah pre-warm spawn dan kill tidak mengalokasi apa pun.
+    """
+    # Index animasi = state * 2 + facing
+    WALK, ATTACK = 0, 1
+    FACING_R, FACING_L = 0, 1
+    ANIM_KEYS = ("walkR", "walkL", "attackR", "attackL")
+
+    def __init__(self, game, capacity=MOB_SWARM_CAPACITY):
         self.game = game
-        self.radius = 5
-        
-        self.original_speed = 1.0 + np.random.rand()  # Kecepatan dasar acak
-        self.speed = self.original_speed
+        self.count = 0
+        self.grows = 0  # berapa kali pool harus diperbesar (idealnya 0)
+
+        # Stat dasar, disesuaikan difficulty saat spawn / apply_scale
         self.original_hp = 50
-        self.hp = self.original_hp  # Gunakan original_hp sebagai dasar
         self.original_damage = 25
-        self.damage = self.original_damage
-        
-        # Rotation and flipping properties
+        self.original_speed = 1.0
+        self.original_radius = 10
+        self.original_frame_w = 128
+        self.original_frame_h = 128
+        self.current_scale = 1.0
+        self.attack_range = 50
+
+        # Rotation and flipping (selalu ikut player)
         self.rotation_angle = 0
         self.flip_horizontal = False
         self.flip_vertical = False
 
         # Animasi
-        self.state = "walk"  # "walk" atau "attack"
-        self.facing = "R"    # "R" atau "L"
-        self.frame = 0
-        self.frame_timer = 0
         self.frame_speed = 0.15
+        self.sprites = [self.load_frames(MOB_SPRITE_PATHS[key]) for key in self.ANIM_KEYS]
+        self.frame_counts = np.array([len(frames) for frames in self.sprites], dtype=np.int32)
+        self._health_bar_strip = None
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64)  # posisi tick sebelumnya
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.hp = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.facing = np.zeros(capacity, dtype=np.int8)
+        self.frame = np.zeros(capacity, dtype=np.int32)
+        self.frame_timer = np.zeros(capacity, dtype=np.float64)
+
+    def _arrays(self):
+        return (self.pos, self.prev_pos, self.speed, self.hp, self.damage, self.radius,
+                self.state, self.facing, self.frame, self.frame_timer)
+
+    def _grow(self):
+        self.reserve(self.capacity * 2)
+
+    def reserve(self, capacity):
+        """Pre-warm pool sampai minimal `capacity` slot"""
+        if capacity <= self.capacity:
+            return
+        old = self._arrays()
+        n = self.count
+        self._allocate(capacity)
+        for new_arr, old_arr in zip(self._arrays(), old):
+            new_arr[:n] = old_arr[:n]
+        self.grows += 1
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def live_count(self):
+        return self.count
+
+    @property
+    def free_count(self):
+        return self.capacity - self.count
+
+    def clear(self):
+        """Kembalikan semua mob ke pool"""
+        self.count = 0
+
+    def stats(self):
+        return {'live': self.live_count, 'free': self.free_count,
+                'capacity': self.capacity, 'grows': self.grows}
+
+    def load_frames(self, path, size=None):
+        return sprite_cache.load_frames(path, self.original_frame_w, self.original_frame_h, size=size)
+
+    def spawn(self, x, y, difficulty=1.0):
+        """Tambah satu mob baru, return index-nya"""
+        if self.count >= self.capacity:
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.pos[i] = (x, y)
+        self.prev_pos[i] = self.pos[i]
+        self.state[i] = self.WALK
+        self.facing[i] = self.FACING_R
+        self.frame[i] = 0
+        self.frame_timer[i] = 0
+        self._apply_difficulty(slice(i, i + 1), difficulty)
+        return i
+
+    def _apply_difficulty(self, idx, difficulty):
+        self.radius[idx] = self.original_radius
+        self.hp[idx] = self.original_hp * difficulty  # HP meningkat dengan difficulty
+        self.speed[idx] = self.original_speed * (1 + (difficulty - 1) * 0.2)  # Sedikit lebih cepat
+        self.damage[idx] = self.original_damage * difficulty  # Damage meningkat
 
-        # Sprite setup
-        self.sprites = {
-            "walkR": self.load_frames("Game/assets/sprites/Mob/WalkR.png"),
-            "walkL": self.load_frames("Game/assets/sprites/Mob/WalkL.png"),
-            "attackR": self.load_frames("Game/assets/sprites/Mob/AttackR.png"),
-            "attackL": self.load_frames("Game/assets/sprites/Mob/AttackL.png"),
-        }
-        self.current_frames = self.sprites["walkR"]
-        
-        # Scaling
-        self.original_speed = 1.0
-        self.original_radius = 10
-        self.original_frame_w = 128
-        self.original_frame_h = 128
-        self.current_scale = 1.0
-        
     def apply_scale(self, scale_factor, difficulty=1.0):
-        """Terapkan scaling ke mob dengan parameter difficulty"""
-        self.current_scale = 1.0  # Selalu gunakan scale 1.0
-        
-        # Scale ukuran sprite tetap normal
-        frame_w = self.original_frame_w
-        frame_h = self.original_frame_h
-        
-        # Properti mob disesuaikan dengan difficulty
-        self.radius = self.original_radius
-        self.hp = self.original_hp * difficulty  # HP meningkat dengan difficulty
-        self.speed = self.original_speed * (1 + (difficulty - 1) * 0.2)  # Sedikit lebih cepat
-        self.damage = self.original_damage * difficulty  # Damage meningkat
-        
-        # Scale ulang semua animasi ke ukuran normal
-        for key in self.sprites.keys():
-            scaled_frames = []
-            for frame in self.sprites[key]:
-                scaled_frame = pygame.transform.smoothscale(frame, (frame_w, frame_h))
-                scaled_frames.append(scaled_frame)
-            self.sprites[key] = scaled_frames
-        
-    def load_frames(self, path):
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        sheet_width, sheet_height = sheet.get_size()
-        frame_w, frame_h = 128, 128
-        num_frames = sheet_width // frame_w
-        for i in range(num_frames):
-            frame = sheet.subsurface((i * frame_w, 0, frame_w, frame_h))
-            frames.append(frame)
-        return frames
+        """Terapkan scaling ke semua mob dengan parameter difficulty"""
+        # Selalu gunakan scale 1.0, frame dari __init__ tetap dipakai (tidak di-scale ulang)
+        self.current_scale = 1.0
+        self._apply_difficulty(slice(0, self.count), difficulty)
+
+    def take_damage(self, idx, amount):
+        """Kurangi HP mob (idx boleh array, index dobel ikut terhitung), return apakah mati"""
+        np.subtract.at(self.hp, idx, amount)
+        return self.hp[idx] <= 0
+
+    def remove(self, indices):
+        """Hapus mob dengan swap-remove (mob terakhir dipindah ke slot yang kosong)"""
+        for i in sorted(set(int(i) for i in indices), reverse=True):
+            if i >= self.count:
+                continue
+            last = self.count - 1
+            if i != last:
+                for arr in self._arrays():
+                    arr[i] = arr[last]
+            self.count = last
+
+    def begin_step(self):
+        """Simpan posisi sebelum tick simulasi (untuk interpolasi render)"""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def render_positions(self, alpha=1.0):
+        """Posisi untuk render, diinterpolasi antara tick sebelumnya dan sekarang"""
+        n = self.count
+        if alpha >= 1.0:
+            return self.pos[:n]
+        return lerp_wrapped(self.prev_pos[:n], self.pos[:n], alpha, self.game.bg_width)
 
     def update(self):
+        target = self.game.player
         # Sync transformations with player
-        self.rotation_angle = self.target.rotation_angle
-        self.flip_horizontal = self.target.flip_horizontal
-        self.flip_vertical = self.target.flip_vertical
-        
-        # Movement logic (independent of player's facing)
+        self.rotation_angle = target.rotation_angle
+        self.flip_horizontal = target.flip_horizontal
+        self.flip_vertical = target.flip_vertical
+
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+
+        # Movement logic (independent of player's facing), X wrap-around
         bg_width = self.game.bg_width
-        dx = self.target.pos[0] - self.pos[0]
-        if abs(dx) > bg_width / 2:
-            dx = dx - bg_width if dx > 0 else dx + bg_width
-        
-        dy = self.target.pos[1] - self.pos[1]
-        direction = np.array([dx, dy])
-        
-        if np.linalg.norm(direction) > 0:
-            direction = direction / np.linalg.norm(direction)
-        
-        # Apply movement (accounting for flips)
-        move_dir = direction.copy()
-        if self.flip_horizontal:
-            move_dir[0] *= -1
-        if self.flip_vertical:
-            move_dir[1] *= -1
-            
-        new_pos = self.pos + move_dir * self.speed
-        
-        # Boundary checks
-        new_pos[0] = new_pos[0] % bg_width
-        new_pos[1] = np.clip(new_pos[1], 0, self.game.bg_height)
-        
-        if self.game.is_walkable(new_pos[0], new_pos[1]):
-            self.pos = new_pos
+        dx = target.pos[0] - pos[:, 0]
+        dx = np.where(np.abs(dx) > bg_width / 2, dx - np.sign(dx) * bg_width, dx)
+        dy = target.pos[1] - pos[:, 1]
+
+        norm = np.hypot(dx, dy)
+        safe_norm = np.where(norm > 0, norm, 1.0)
+        dir_x = dx / safe_norm
+        dir_y = dy / safe_norm
+
+        # Jauh dari player: ikuti flow field (memutari tembok), dekat: langsung menuju player
+        flow = self.game.flow_field.lookup(pos[:, 0], pos[:, 1])
+        use_flow = (norm > FLOW_FIELD_DIRECT_RANGE) & flow.any(axis=1)
+        dir_x = np.where(use_flow, flow[:, 0], dir_x)
+        dir_y = np.where(use_flow, flow[:, 1], dir_y)
+
+        # Flip dulu baru steering, supaya separation/cohesion tetap di ruang dunia
+        flip_x = -1.0 if self.flip_horizontal else 1.0
+        flip_y = -1.0 if self.flip_vertical else 1.0
+        dir_x, dir_y = self.steer(pos, dir_x * flip_x, dir_y * flip_y)
+
+        speed = self.speed[:n]
+        new_x = (pos[:, 0] + dir_x * speed) % bg_width
+        new_y = np.clip(pos[:, 1] + dir_y * speed, 0, self.game.bg_height)
+
+        walkable = self.game.is_walkable_many(new_x, new_y)
+        # Terhalang: coba geser di satu sumbu saja (meluncur di sepanjang tembok)
+        blocked = ~walkable
+        slide_x = blocked & self.game.is_walkable_many(new_x, pos[:, 1])
+        slide_y = blocked & ~slide_x & self.game.is_walkable_many(pos[:, 0], new_y)
+        pos[walkable, 0] = new_x[walkable]
+        pos[walkable, 1] = new_y[walkable]
+        pos[slide_x, 0] = new_x[slide_x]
+        pos[slide_y, 1] = new_y[slide_y]
 
         # Animation state
-        dist_to_player = np.linalg.norm(self.target.pos - self.pos)
-        self.state = "attack" if dist_to_player < 50 else "walk"
-        self.facing = "R" if direction[0] >= 0 else "L"  # Keep original facing for animation
-        
+        dist_to_player = np.hypot(target.pos[0] - pos[:, 0], target.pos[1] - pos[:, 1])
+        self.state[:n] = np.where(dist_to_player < self.attack_range, self.ATTACK, self.WALK)
+        self.facing[:n] = np.where(dir_x * flip_x >= 0, self.FACING_R, self.FACING_L)
+
         # Animation update
-        self.current_frames = self.sprites[f"{self.state}{self.facing}"]
-        self.frame_timer += self.frame_speed
-        if self.frame_timer >= 1:
-            self.frame = (self.frame + 1) % len(self.current_frames)
-            self.frame_timer = 0
-
-    def draw(self, surface, offset):
-        if not self.current_frames or self.frame >= len(self.current_frames):
+        timer = self.frame_timer[:n]
+        timer += self.frame_speed
+        tick = timer >= 1
+        if tick.any():
+            anim = self.state[:n] * 2 + self.facing[:n]
+            frame = self.frame[:n]
+            frame[tick] = (frame[tick] + 1) % self.frame_counts[anim[tick]]
+            timer[tick] = 0
+
+    def steer(self, pos, dir_x, dir_y):
+        """Tambahkan separation dan cohesion dari tetangga terdekat (lewat spatial hash) ke arah gerak"""
+        n = len(pos)
+        if n < 2 or not (MOB_SEPARATION_WEIGHT or MOB_COHESION_WEIGHT):
+            return dir_x, dir_y
+        grid = self.game.mob_grid
+        grid.build(pos)
+        i, _, delta, dist = grid.neighbor_pairs(MOB_NEIGHBOR_RADIUS, MOB_MAX_NEIGHBORS_PER_CELL)
+        if len(i) == 0:
+            return dir_x, dir_y
+        counts = np.bincount(i, minlength=n)
+        has_neighbors = counts > 0
+        safe_counts = np.maximum(counts, 1)
+
+        # Separation: dorong menjauh dari tetangga yang terlalu dekat, makin dekat makin kuat.
+        # Dijumlah (bukan dirata-rata) supaya kerumunan padat terdorong lebih kuat
+        push = np.clip(1 - dist / MOB_SEPARATION_RADIUS, 0, 1) / np.maximum(dist, 1e-6)
+        sep_x = -np.bincount(i, delta[:, 0] * push, minlength=n)
+        sep_y = -np.bincount(i, delta[:, 1] * push, minlength=n)
+        # Cohesion: sedikit tertarik ke rata-rata posisi tetangga
+        coh_x = np.bincount(i, delta[:, 0], minlength=n) / safe_counts / MOB_NEIGHBOR_RADIUS
+        coh_y = np.bincount(i, delta[:, 1], minlength=n) / safe_counts / MOB_NEIGHBOR_RADIUS
+
+        steer_x = dir_x + MOB_SEPARATION_WEIGHT * sep_x + MOB_COHESION_WEIGHT * coh_x
+        steer_y = dir_y + MOB_SEPARATION_WEIGHT * sep_y + MOB_COHESION_WEIGHT * coh_y
+        norm = np.hypot(steer_x, steer_y)
+        steer_x = np.where(norm > 0, steer_x / np.where(norm > 0, norm, 1), 0)
+        steer_y = np.where(norm > 0, steer_y / np.where(norm > 0, norm, 1), 0)
+        return np.where(has_neighbors, steer_x, dir_x), np.where(has_neighbors, steer_y, dir_y)
+
+    def health_bar_strip(self, width, height):
+        """Strip merah yang di-render sekali; health bar = blit sebagian strip ini"""
+        strip = self._health_bar_strip
+        if strip is None or strip.get_width() < width or strip.get_height() != height:
+            strip = pygame.Surface((max(width, 64), height))
+            strip.fill((255, 0, 0))
+            self._health_bar_strip = strip
+        return strip
+
+    def submit(self, queue, offset, alpha=1.0):
+        """Masukkan mob yang terlihat ke render queue (sprite + health bar)"""
+        n = self.count
+        if n == 0:
             return
-            
-        frame_img = self.current_frames[self.frame]
-        
-        # Apply transformations in same order as player
-        transformed_img = pygame.transform.flip(
-            frame_img, 
-            self.flip_horizontal, 
-            self.flip_vertical
-        )
-        if self.rotation_angle != 0:
-            transformed_img = pygame.transform.rotate(transformed_img, self.rotation_angle)
-        
-        # Calculate draw position
-        draw_pos = self.pos + offset
-        rect = transformed_img.get_rect(center=draw_pos.astype(int))
-        surface.blit(transformed_img, rect)
-
-        # Draw health bar (accounting for scale)
+        bg_width = self.game.bg_width
+        positions = self.render_positions(alpha) + offset
+        # X dunia wrap: pakai salinan yang paling dekat dengan tengah layar
+        positions[:, 0] = wrap_near(positions[:, 0], SCREEN_WIDTH / 2, bg_width)
+        index = np.arange(n)
+        if bg_width < SCREEN_WIDTH:
+            # Dunia lebih sempit dari layar, salinan kiri-kanan juga terlihat
+            positions = np.concatenate([positions, positions - (bg_width, 0), positions + (bg_width, 0)])
+            index = np.tile(index, 3)
+
+        # Cull sebelum lookup frame: sprite (ter-rotate, pakai setengah diagonal) atau health bar di layar
         bar_width = 50 * self.current_scale
-        health_width = (self.hp / 50) * bar_width
-        health_pos = (draw_pos[0] - bar_width/2, draw_pos[1] - 40 * self.current_scale)
-        pygame.draw.rect(surface, (255,0,0), (*health_pos, health_width, 5 * self.current_scale))
-
-        # Draw wrapped versions (if needed)
-        if self.game.bg_width < SCREEN_WIDTH:
-            # Left wrap
-            left_pos = draw_pos.copy()
-            left_pos[0] -= self.game.bg_width
-            rect = transformed_img.get_rect(center=left_pos.astype(int))
-            surface.blit(transformed_img, rect)
-            pygame.draw.rect(surface, (255,0,0), (left_pos[0]-bar_width/2, left_pos[1]-40*self.current_scale, health_width, 5*self.current_scale))
-            
-            # Right wrap
-            right_pos = draw_pos.copy()
-            right_pos[0] += self.game.bg_width
-            rect = transformed_img.get_rect(center=right_pos.astype(int))
-            surface.blit(transformed_img, rect)
-            pygame.draw.rect(surface, (255,0,0), (right_pos[0]-bar_width/2, right_pos[1]-40*self.current_scale, health_width, 5*self.current_scale))
-
-    def take_damage(self, amount):
-        self.hp -= amount
-        return self.hp <= 0
\ No newline at end of file
+        bar_height = 5 * self.current_scale
+        bar_top = 40 * self.current_scale
+        health_width = self.hp[index] / 50 * bar_width
+        x, y = positions[:, 0], positions[:, 1]
+        reach = np.hypot(self.original_frame_w, self.original_frame_h) / 2
+        visible = (queue.visible_mask(x - reach, y - reach, x + reach, y + reach)
+                   | queue.visible_mask(x - bar_width / 2, y - bar_top,
+                                        x - bar_width / 2 + health_width, y - bar_top + bar_height))
+        queue.add_culled(int(len(visible) - np.count_nonzero(visible)))
+
+        strip = None
+        for i, p, width in zip(index[visible], positions[visible], health_width[visible]):
+            frames = self.sprites[self.state[i] * 2 + self.facing[i]]
+            frame_img = frames[self.frame[i] % len(frames)]
+
+            # Apply transformations in same order as player (hasil dari cache bersama)
+            transformed_img = transform_cache.get(
+                frame_img,
+                self.flip_horizontal,
+                self.flip_vertical,
+                self.rotation_angle
+            )
+            cx, cy = int(p[0]), int(p[1])
+            queue.submit(transformed_img,
+                         (cx - transformed_img.get_width() // 2, cy - transformed_img.get_height() // 2),
+                         sort_y=p[1])
+
+            # Health bar (accounting for scale), digambar di layer overlay setelah semua sprite
+            bar = pygame.Rect(p[0] - bar_width / 2, p[1] - bar_top, width, bar_height)
+            if strip is None or strip.get_width() < bar.width:
+                strip = self.health_bar_strip(bar.width, bar.height)
+            queue.submit(strip, bar.topleft, area=(0, 0, bar.width, bar.height), layer=queue.OVERLAY)
@@ -8,12 +8,35 @@ import math
 # Fix import path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from settings import *
+from src.systems.sprite_cache import sprite_cache
+from src.entities.projectile_pool import ProjectilePool
+from src.systems.transform_cache import transform_cache
+from src.utils.vectors import wrap_near
+
+PLAYER_SPRITE_PATHS = {
+    'idleR': 'Game/assets/sprites/MC/IdleR.png',
+    'idleL': 'Game/assets/sprites/MC/IdleL.png',
+    'attackR': 'Game/assets/sprites/MC/ShotR.png',
+    'attackL': 'Game/assets/sprites/MC/ShotL.png',
+    'walkR': 'Game/assets/sprites/MC/WalkR.png',
+    'walkL': 'Game/assets/sprites/MC/WalkL.png',
+    'runR': 'Game/assets/sprites/MC/RunR.png',
+    'runL': 'Game/assets/sprites/MC/RunL.png',
+}
+PLAYER_FRAME_COUNTS = {
+    'IdleR.png': 11, 'IdleL.png': 11,
+    'ShotR.png': 4,  # <-- Ubah ke 4
+    'ShotL.png': 4,  # <-- Ubah ke 4
+    'WalkR.png': 10,  'WalkL.png': 10,
+    'RunR.png': 10,  'RunL.png': 10
+}
 
 class Player(Sprite):
     def __init__(self, pos, game,):
         super().__init__()
         # Position and physics
         self.pos = np.array(pos, dtype='float64')
+        self.prev_pos = self.pos.copy()  # posisi tick sebelumnya (untuk interpolasi render)
         self.vel = np.zeros(2)
         self.acc = np.zeros(2)
         self.speed = 5.0
@@ -32,16 +55,11 @@ class Player(Sprite):
         # Animation properties
         self.sprite_width = 128
         self.sprite_height = 128
-        self.animations = {
-            'idleR': self.load_sprites('Game/assets/sprites/MC/IdleR.png'),
-            'idleL': self.load_sprites('Game/assets/sprites/MC/IdleL.png'),
-            'attackR': self.load_sprites('Game/assets/sprites/MC/ShotR.png'),
-            'attackL': self.load_sprites('Game/assets/sprites/MC/ShotL.png'),
-            'walkR': self.load_sprites('Game/assets/sprites/MC/WalkR.png'),
-            'walkL': self.load_sprites('Game/assets/sprites/MC/WalkL.png'),
-            'runR': self.load_sprites('Game/assets/sprites/MC/RunR.png'),
-            'runL': self.load_sprites('Game/assets/sprites/MC/RunL.png'),
-        }
+        self.original_sprite_width = 128
+        self.original_sprite_height = 128
+        # Set animasi per ukuran sprite (level zoom), zoom cukup menukar dict-nya
+        self.animation_levels = {}
+        self.animations = self.animations_for_size((self.sprite_width, self.sprite_height))
         self.state = 'idleR'
         self.direction = (0, 1)  # Default facing down
         self.frame_index = 0
@@ -57,7 +75,7 @@ class Player(Sprite):
         self.hp = 300
         self.max_hp = 300
         self.stamina = 300
-        self.projectiles = []
+        self.projectiles = ProjectilePool(PROJECTILE_POOL_CAPACITY)
         self.projectile_speed = 30
         self.projectile_radius = 5
         self.projectile_color = (255, 255, 0)
@@ -71,8 +89,6 @@ class Player(Sprite):
             'attackR': len(self.animations['attackR'][0]),
             'attackL': len(self.animations['attackL'][0])
         }
-        self.original_sprite_width = 128
-        self.original_sprite_height = 128
         self.original_speed = 5.0
         self.original_run_speed = 8.0
         self.original_projectile_radius = 5
@@ -92,46 +108,45 @@ class Player(Sprite):
         # Scale projectile
         self.projectile_radius = int(self.original_projectile_radius * scale_factor)
         
-        # Scale ulang semua animasi
-        for anim_name, anim_frames in self.animations.items():
-            for dir_idx in range(4):
-                for frame_idx in range(len(anim_frames[dir_idx])):
-                    original_frame = anim_frames[dir_idx][frame_idx]
-                    scaled_size = (self.sprite_width, self.sprite_height)
-                    self.animations[anim_name][dir_idx][frame_idx] = pygame.transform.smoothscale(original_frame, scaled_size)
+        # Tukar ke set animasi ukuran ini (di-scale dari frame asli, sekali per ukuran)
+        self.animations = self.animations_for_size((self.sprite_width, self.sprite_height))
         
         # Update image dan rect saat ini
         dir_index = self.get_direction_index(self.direction)
         self.image = self.animations[self.state][dir_index][int(self.frame_index)]
         self.rect = self.image.get_rect(center=self.pos)
         
-    def load_sprites(self, path):
+    def animations_for_size(self, size):
+        animations = self.animation_levels.get(size)
+        if animations is None:
+            animations = {name: self.load_sprites(path, size) for name, path in PLAYER_SPRITE_PATHS.items()}
+            self.animation_levels[size] = animations
+        return animations
+
+    def scaled_size(self, scale_factor):
+        return (int(self.original_sprite_width * scale_factor),
+                int(self.original_sprite_height * scale_factor))
+
+    def prewarm_scales(self, scales):
+        """Scale frame untuk semua level zoom di background, jadi +/- tidak perlu resample"""
+        sprite_cache.warm_async(
+            (path, self.original_sprite_width, self.original_sprite_height,
+             PLAYER_FRAME_COUNTS.get(Path(path).name, 1), self.scaled_size(scale))
+            for scale in scales for path in PLAYER_SPRITE_PATHS.values())
+
+    def load_sprites(self, path, size=None):
         """Load single-row sprite sheet and split into animation frames"""
-        frame_counts = {
-            'IdleR.png': 11, 'IdleL.png': 11,
-            'ShotR.png': 4,  # <-- Ubah ke 4
-            'ShotL.png': 4,  # <-- Ubah ke 4
-            'WalkR.png': 10,  'WalkL.png': 10,
-            'RunR.png': 10,  'RunL.png': 10
-        }
         filename = Path(path).name
-        num_frames = frame_counts.get(filename, 1)
+        num_frames = PLAYER_FRAME_COUNTS.get(filename, 1)
         try:
-            sheet = pygame.image.load(path).convert_alpha()
-            sheet_width = sheet.get_width()
-            max_frames = sheet_width // self.sprite_width
-            if num_frames > max_frames:
-                print(f"Warning: {filename} only has {max_frames} frames, but {num_frames} requested.")
-                num_frames = max_frames
-            frames = []
-            for i in range(num_frames):
-                x = i * self.sprite_width
-                frame = sheet.subsurface(pygame.Rect(x, 0, self.sprite_width, self.sprite_height))
-                frames.append(frame)
+            frames = sprite_cache.load_frames(path, self.original_sprite_width, self.original_sprite_height,
+                                              num_frames, size=size)
+            if len(frames) < num_frames:
+                print(f"Warning: {filename} only has {len(frames)} frames, but {num_frames} requested.")
             return [frames] * 4
         except Exception as e:
             print(f"Failed to load spritesheet: {path} ({e})")
-            blank_frame = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA)
+            blank_frame = pygame.Surface(size or (self.sprite_width, self.sprite_height), pygame.SRCALPHA)
             return [[blank_frame] * num_frames] * 4
 
     def get_direction_index(self, direction):
@@ -257,14 +272,9 @@ class Player(Sprite):
         """Create a new projectile and set attack animation"""
         if self.can_attack and np.any(self.facing) and not self.is_attacking:
             # Posisi peluru benar-benar di tengah sprite player
-            projectile_pos = self.pos.copy()
-            self.projectiles.append({
-                'pos': projectile_pos,
-                'direction': self.facing.copy(),
-                'speed': self.projectile_speed,
-                'radius': self.projectile_radius,
-                'lifetime': 60
-            })
+            if not self.projectiles.spawn(self.pos, self.facing, self.projectile_speed,
+                                          self.projectile_radius, 60):
+                return False
             self.can_attack = False
             self.attack_cooldown = self.attack_cooldown_max
             if self.facing[0] < 0:
@@ -278,21 +288,16 @@ class Player(Sprite):
 
     def update_projectiles(self):
         """Update all active projectiles"""
-        for proj in self.projectiles[:]:
-            proj['pos'] += proj['direction'] * proj['speed']
-            proj['lifetime'] -= 1
-            if proj['lifetime'] <= 0:
-                self.projectiles.remove(proj)
+        self.projectiles.update()
 
-    def draw_projectiles(self, surface, offset):
-        """Draw all active projectiles"""
-        for proj in self.projectiles:
-            pygame.draw.circle(
-                surface,
-                self.projectile_color,
-                (proj['pos'] + offset).astype(int),
-                proj['radius']
-            )
+    def draw_projectiles(self, surface, offset, alpha=1.0):
+        """Draw all active projectiles, return list rect yang digambar"""
+        n = len(self.projectiles)
+        positions = self.projectiles.render_positions(alpha) + offset
+        positions[:, 0] = wrap_near(positions[:, 0], SCREEN_WIDTH / 2, self.game.bg_width)
+        positions = positions.astype(int)
+        return [pygame.draw.circle(surface, self.projectile_color, pos, radius)
+                for pos, radius in zip(positions, self.projectiles.radius[:n])]
 
     def take_damage(self, amount):
         """Apply damage to player"""
@@ -317,8 +322,10 @@ class Player(Sprite):
             self.pos[1] + offset[1] - self.sprite_height//2 - 10,
             fill, bar_height
         )
-        pygame.draw.rect(surface, (255, 0, 0), fill_rect)
-        pygame.draw.rect(surface, (255, 255, 255), outline_rect, 1)
+        dirty = [
+            pygame.draw.rect(surface, (255, 0, 0), fill_rect),
+            pygame.draw.rect(surface, (255, 255, 255), outline_rect, 1),
+        ]
 
         # Draw stamina bar (selalu tampil)
         stamina_width = 30
@@ -328,26 +335,23 @@ class Player(Sprite):
             self.pos[1] + offset[1] - self.sprite_height//2 - 20,
             stamina_fill, 3
         )
-        pygame.draw.rect(surface, (0, 200, 255), stamina_rect)
+        dirty.append(pygame.draw.rect(surface, (0, 200, 255), stamina_rect))
+        return dirty
 
-    def draw(self, surface, offset=np.zeros(2)):
-        """Draw player with rotation and flipping"""
+    def submit(self, queue, offset=np.zeros(2)):
+        """Masukkan sprite player (rotate + flip) ke render queue, di-sort y bersama mob"""
         # Get current animation frame
         dir_index = self.get_direction_index(self.direction)
         original_image = self.animations[self.state][dir_index][int(self.frame_index)]
         
-        # Apply transformations
-        transformed_image = original_image
-        if self.flip_horizontal or self.flip_vertical:
-            transformed_image = pygame.transform.flip(
-                transformed_image, 
-                self.flip_horizontal, 
-                self.flip_vertical
-            )
-        if self.rotation_angle != 0:
-            transformed_image = pygame.transform.rotate(transformed_image, self.rotation_angle)
+        # Apply transformations (flip lalu rotate, hasil dari cache bersama)
+        transformed_image = transform_cache.get(
+            original_image,
+            self.flip_horizontal,
+            self.flip_vertical,
+            self.rotation_angle
+        )
         
         # Calculate draw position
         draw_pos = (self.pos + offset - [self.sprite_width//2, self.sprite_height//2]).astype(int)
-        surface.blit(transformed_image, draw_pos)
-        self.draw_health_bar(surface, offset)
\ No newline at end of file
+        queue.submit(transformed_image, draw_pos, sort_y=self.pos[1] + offset[1])
\ No newline at end of file
@@ -0,0 +1,75 @@
+import numpy as np
+from src.utils.vectors import lerp_wrapped
+
+
+class ProjectilePool:
+    """Pool projectile berkapasitas tetap, disimpan sebagai array NumPy paralel"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64)  # posisi tick sebelumnya
+        self.direction = np.zeros((capacity, 2), dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def _arrays(self):
+        return (self.pos, self.prev_pos, self.direction, self.speed, self.radius, self.lifetime, self.alive)
+
+    def spawn(self, pos, direction, speed, radius, lifetime):
+        """Isi slot kosong berikutnya, return False jika pool sudah penuh"""
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.pos[i] = pos
+        self.prev_pos[i] = pos
+        self.direction[i] = direction
+        self.speed[i] = speed
+        self.radius[i] = radius
+        self.lifetime[i] = lifetime
+        self.alive[i] = True
+        self.count += 1
+        return True
+
+    def kill(self, idx):
+        """Tandai projectile mati, slot dibersihkan saat compact()"""
+        self.alive[idx] = False
+
+    def compact(self):
+        """Swap-remove semua projectile yang sudah mati"""
+        dead = np.flatnonzero(~self.alive[:self.count])
+        for i in dead[::-1]:
+            last = self.count - 1
+            if i != last:
+                for arr in self._arrays():
+                    arr[i] = arr[last]
+            self.count = last
+
+    def begin_step(self):
+        """Simpan posisi sebelum tick simulasi (untuk interpolasi render)"""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def render_positions(self, alpha=1.0):
+        n = self.count
+        if alpha >= 1.0:
+            return self.pos[:n]
+        return lerp_wrapped(self.prev_pos[:n], self.pos[:n], alpha)
+
+    def update(self):
+        """Gerakkan semua projectile dan hapus yang lifetime-nya habis"""
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.direction[:n] * self.speed[:n, None]
+        self.lifetime[:n] -= 1
+        self.alive[:n] &= self.lifetime[:n] > 0
+        self.compact()
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.count = 0
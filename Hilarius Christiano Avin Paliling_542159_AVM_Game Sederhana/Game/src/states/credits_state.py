@@ -1,16 +1,19 @@
 from .game_state import GameState
 import pygame
+from src.systems.text_cache import text_cache
+from src.systems.font_registry import font_registry
+from settings import CREDITS_EFFECT_FRAMES
+import numpy as np
 import os
 import random
-import math
 
 class CreditsState(GameState):
     def __init__(self, game):
         super().__init__(game)
         # Initialize fonts
-        self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 28)
-        self.small_font = pygame.font.SysFont('Arial', 20)
+        self.title_font = font_registry.get('Arial', 48, bold=True)
+        self.text_font = font_registry.get('Arial', 28)
+        self.small_font = font_registry.get('Arial', 20)
         
         # Credit information
         self.credit_lines = [
@@ -36,6 +39,11 @@ class CreditsState(GameState):
                     "frequency": random.uniform(0.01, 0.05)}
         }
         
+        # Frame efek zoom/pixelate, dibuat sekali per level lalu dipakai ulang
+        self.effect_frames = {}
+        if self.animation_type == "wave":
+            self.setup_wave()
+        
         # Semi-transparent overlay
         self.overlay = pygame.Surface((game.screen.get_width(), game.screen.get_height()), pygame.SRCALPHA)
         self.overlay.fill((0, 0, 0, 180))
@@ -50,6 +58,77 @@ class CreditsState(GameState):
             bg.fill((20, 20, 40, 255))
             return bg
 
+    def centered(self, image):
+        return image.get_rect(center=(self.game.screen.get_width()//2,
+                                      self.game.screen.get_height()//2))
+
+    def effect_frame(self, effect, level, builder):
+        """Frame (surface, rect) untuk level efek tertentu, di-build hanya saat pertama dipakai"""
+        key = (effect, level)
+        frame = self.effect_frames.get(key)
+        if frame is None:
+            image = builder(level)
+            frame = (image, self.centered(image))
+            self.effect_frames[key] = frame
+        return frame
+
+    def effect_level(self, value, start, end):
+        """Petakan nilai parameter animasi ke salah satu dari CREDITS_EFFECT_FRAMES level"""
+        t = (value - start) / (end - start)
+        return min(max(int(t * CREDITS_EFFECT_FRAMES), 0), CREDITS_EFFECT_FRAMES - 1)
+
+    def build_zoom_frame(self, level):
+        params = self.animation_params["zoom"]
+        scale = 1.0 + (params["target_scale"] - 1.0) * level / CREDITS_EFFECT_FRAMES
+        return pygame.transform.scale(self.original_bg, (int(self.original_bg.get_width() * scale),
+                                                         int(self.original_bg.get_height() * scale)))
+
+    def build_pixelate_frame(self, level):
+        max_pixel = self.animation_params["pixelate"]["max_pixel"]
+        pixel_size = 1 + (max_pixel - 1) * level / CREDITS_EFFECT_FRAMES
+        if pixel_size <= 1:
+            return self.original_bg
+        size = self.original_bg.get_size()
+        small = pygame.transform.scale(self.original_bg,
+            (int(size[0] / pixel_size), int(size[1] / pixel_size)))
+        return pygame.transform.scale(small, size)
+
+    def setup_wave(self):
+        """Siapkan buffer untuk efek wave: tiap baris digeser dengan satu np.take per frame"""
+        params = self.animation_params["wave"]
+        amplitude = params["amplitude"]
+        w, h = self.original_bg.get_size()
+        # Pixel sumber (format surface asli, 1 pixel = 1 int) diberi padding transparan
+        # di kiri-kanan selebar amplitude, jadi index hasil geser tidak pernah keluar dari array
+        padded = np.zeros((h, w + 2 * amplitude), dtype=np.uint32)
+        padded[:, amplitude:amplitude + w] = pygame.surfarray.array2d(self.original_bg).T
+        self.wave_source = padded.reshape(-1)
+        rows = np.arange(h)
+        self.wave_base_index = (rows[:, None] * padded.shape[1] + amplitude + np.arange(w)).astype(np.intp)
+        # Offset dihitung per 2 baris seperti versi blit per baris sebelumnya
+        self.wave_rows = (rows // 2 * 2).astype(np.float64)
+        self.wave_phase = np.empty(h, dtype=np.float64)
+        self.wave_offsets = np.empty(h, dtype=np.intp)
+        self.wave_index = np.empty((h, w), dtype=np.intp)
+        # Format sama dengan background supaya blit tidak perlu konversi pixel
+        self.wave_surface = self.original_bg.copy()
+
+    def render_wave(self):
+        params = self.animation_params["wave"]
+        np.multiply(self.wave_rows, params["frequency"], out=self.wave_phase)
+        self.wave_phase += params["time"]
+        np.sin(self.wave_phase, out=self.wave_phase)
+        self.wave_phase *= params["amplitude"]
+        # Dibulatkan ke arah nol, sama seperti posisi float pada Surface.blit
+        np.copyto(self.wave_offsets, self.wave_phase, casting='unsafe')
+        np.subtract(self.wave_base_index, self.wave_offsets[:, None], out=self.wave_index)
+        pixels = pygame.surfarray.pixels2d(self.wave_surface)
+        # mode='clip': padding sudah menjamin index valid, dan tanpa mode 'raise' numpy menulis
+        # langsung ke pixel surface (out tidak contiguous) tanpa buffer sementara seukuran gambar
+        np.take(self.wave_source, self.wave_index, out=pixels.T, mode='clip')
+        del pixels  # unlock surface sebelum di-blit
+        return self.wave_surface
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
             self.game.change_state('menu')
@@ -63,12 +142,9 @@ class CreditsState(GameState):
             if params["scale"] > params["target_scale"]:
                 params["scale"] = 1.0  # Reset zoom
             
-            # Apply scaling
-            new_width = int(self.original_bg.get_width() * params["scale"])
-            new_height = int(self.original_bg.get_height() * params["scale"])
-            self.background = pygame.transform.scale(self.original_bg, (new_width, new_height))
-            self.bg_rect = self.background.get_rect(center=(self.game.screen.get_width()//2, 
-                                                      self.game.screen.get_height()//2))
+            # Ambil frame zoom yang sudah di-scale, bukan scale ulang tiap frame
+            level = self.effect_level(params["scale"], 1.0, params["target_scale"])
+            self.background, self.bg_rect = self.effect_frame("zoom", level, self.build_zoom_frame)
             
         elif self.animation_type == "pan":
             params["offset_x"] += params["direction"][0] * 2
@@ -90,8 +166,9 @@ class CreditsState(GameState):
                 if params["alpha"] <= 0:
                     params["fade_in"] = True
             
-            self.background = self.original_bg.copy()
-            self.background.fill((255, 255, 255, params["alpha"]), special_flags=pygame.BLEND_RGBA_MULT)
+            # Alpha surface digabung dengan alpha per-pixel saat blit, tanpa copy gambar
+            self.background = self.original_bg
+            self.background.set_alpha(max(0, min(255, params["alpha"])))
             
         elif self.animation_type == "pixelate":
             if params["increasing"]:
@@ -103,15 +180,9 @@ class CreditsState(GameState):
                 if params["pixel_size"] <= 1:
                     params["increasing"] = True
             
-            # Apply pixelation effect
-            if params["pixel_size"] > 1:
-                small = pygame.transform.scale(self.original_bg, 
-                    (int(self.original_bg.get_width() / params["pixel_size"]), 
-                     int(self.original_bg.get_height() / params["pixel_size"])))
-                self.background = pygame.transform.scale(small, 
-                    (self.original_bg.get_width(), self.original_bg.get_height()))
-            else:
-                self.background = self.original_bg.copy()
+            # Apply pixelation effect (frame per level di-cache)
+            level = self.effect_level(params["pixel_size"], 1, params["max_pixel"])
+            self.background, self.bg_rect = self.effect_frame("pixelate", level, self.build_pixelate_frame)
                 
         elif self.animation_type == "wave":
             params["time"] += 0.1
@@ -126,17 +197,8 @@ class CreditsState(GameState):
             surface.blit(self.background, offset_rect)
             
         elif self.animation_type == "wave":
-            # Apply wave distortion
-            wave_params = self.animation_params["wave"]
-            temp_surface = pygame.Surface((self.background.get_width(), 
-                                         self.background.get_height()), pygame.SRCALPHA)
-            
-            for y in range(0, self.background.get_height(), 2):  # Step by 2 for performance
-                offset = math.sin(y * wave_params["frequency"] + wave_params["time"]) * wave_params["amplitude"]
-                temp_surface.blit(self.background, (offset, y), 
-                                (0, y, self.background.get_width(), 2))
-            
-            surface.blit(temp_surface, self.bg_rect)
+            # Apply wave distortion (geser baris di buffer yang dipakai ulang)
+            surface.blit(self.render_wave(), self.bg_rect)
             
         else:
             surface.blit(self.background, self.bg_rect)
@@ -145,9 +207,9 @@ class CreditsState(GameState):
         surface.blit(self.overlay, (0, 0))
         
         # Draw title with shadow effect
-        title = self.title_font.render("CREDITS", True, (50, 50, 50))
+        title = text_cache.render(self.title_font, "CREDITS", True, (50, 50, 50))
         surface.blit(title, (surface.get_width()//2 - title.get_width()//2 + 3, 103))
-        title = self.title_font.render("CREDITS", True, (255, 215, 0))
+        title = text_cache.render(self.title_font, "CREDITS", True, (255, 215, 0))
         surface.blit(title, (surface.get_width()//2 - title.get_width()//2, 100))
         
         # Draw credit lines
@@ -155,10 +217,10 @@ class CreditsState(GameState):
         line_spacing = 45
         
         for line in self.credit_lines:
-            shadow = self.text_font.render(line, True, (20, 20, 20))
+            shadow = text_cache.render(self.text_font, line, True, (20, 20, 20))
             surface.blit(shadow, (surface.get_width()//2 - shadow.get_width()//2 + 2, y_position + 2))
             
-            text = self.text_font.render(line, True, (200, 255, 200))
+            text = text_cache.render(self.text_font, line, True, (200, 255, 200))
             surface.blit(text, (surface.get_width()//2 - text.get_width()//2, y_position))
             y_position += line_spacing
         
@@ -168,7 +230,7 @@ class CreditsState(GameState):
                         (surface.get_width()//2 + 100, y_position + 20), 2)
         
         # Instruction text
-        instruction = self.small_font.render("Press any key or click to return to menu", 
+        instruction = text_cache.render(self.small_font, "Press any key or click to return to menu", 
                                            True, (200, 200, 255))
         surface.blit(instruction, (surface.get_width()//2 - instruction.get_width()//2, 
                                  y_position + 50))
\ No newline at end of file
@@ -3,6 +3,10 @@ class GameState:
     def __init__(self, game):
         self.game = game
 
+    def preload(self):
+        """Load asset state ini lebih awal (boleh dipanggil dari background thread)"""
+        pass
+
     def enter(self):
         pass
 
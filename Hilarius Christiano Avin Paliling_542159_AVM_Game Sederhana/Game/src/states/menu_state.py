@@ -1,6 +1,8 @@
 from .game_state import GameState
 import pygame
 from settings import TITLE
+from src.systems.text_cache import text_cache
+from src.systems.font_registry import font_registry
 
 class MenuState(GameState):
     def __init__(self, game):
@@ -37,8 +39,8 @@ class MenuState(GameState):
 
     def load_assets(self):
         # Load fonts
-        self.title_font = pygame.font.Font(None, 72)
-        self.option_font = pygame.font.Font(None, 42)
+        self.title_font = font_registry.get(None, 72)
+        self.option_font = font_registry.get(None, 42)
         
         # Create background surface - access screen dimensions through the game reference
         self.background = pygame.Surface((self.game.screen_width, self.game.screen_height))
@@ -56,8 +58,12 @@ class MenuState(GameState):
             pygame.draw.line(self.background, color, (0, y), (self.game.screen_width, y))
         
         # Font yang lebih modern
-        self.title_font = pygame.font.Font(None, 80)
-        self.option_font = pygame.font.Font(None, 48)
+        self.title_font = font_registry.get(None, 80)
+        self.option_font = font_registry.get(None, 48)
+
+        # Panel glass cukup dibuat sekali
+        self.glass_surface = pygame.Surface((500, self.game.screen_height - 100), pygame.SRCALPHA)
+        pygame.draw.rect(self.glass_surface, (30, 30, 60, 150), self.glass_surface.get_rect(), border_radius=25)
     
     def update(self):
         pass
@@ -75,20 +81,18 @@ class MenuState(GameState):
         )
         
         # Efek glass (transparan dengan blur)
-        glass_surface = pygame.Surface((500, self.game.screen_height - 100), pygame.SRCALPHA)
-        pygame.draw.rect(glass_surface, (30, 30, 60, 150), glass_surface.get_rect(), border_radius=25)
-        surface.blit(glass_surface, (self.game.screen_width//2 - 250, 50))
+        surface.blit(self.glass_surface, (self.game.screen_width//2 - 250, 50))
         
         # Judul game dengan efek neon
-        title = self.title_font.render("SURVIVAL HARDCORE", True, (50, 255, 50))
-        title_shadow = self.title_font.render("SURVIVAL HARDCORE", True, (0, 100, 0))
+        title = text_cache.render(self.title_font, "SURVIVAL HARDCORE", True, (50, 255, 50))
+        title_shadow = text_cache.render(self.title_font, "SURVIVAL HARDCORE", True, (0, 100, 0))
         
         # Efek glow
         surface.blit(title_shadow, (self.game.screen_width//2 - title.get_width()//2 + 3, 80 + 3))
         surface.blit(title, (self.game.screen_width//2 - title.get_width()//2, 80))
         
         # Subtitle
-        subtitle = self.option_font.render("MATRIX EDITION", True, (200, 200, 255))
+        subtitle = text_cache.render(self.option_font, "MATRIX EDITION", True, (200, 200, 255))
         surface.blit(subtitle, (self.game.screen_width//2 - subtitle.get_width()//2, 160))
         
         # Menu options dengan efek hover modern
@@ -106,5 +110,5 @@ class MenuState(GameState):
                 pygame.draw.rect(surface, (50, 50, 80, 100), rect, border_radius=15)
                 text_color = option["color"]
             
-            text = self.option_font.render(option["text"], True, text_color)
+            text = text_cache.render(self.option_font, option["text"], True, text_color)
             surface.blit(text, (self.game.screen_width//2 - text.get_width()//2, y_pos))
\ No newline at end of file
@@ -1,7 +1,14 @@
 from .game_state import GameState
 import pygame
+from src.systems.text_cache import text_cache
+from src.systems.font_registry import font_registry
 
 class PauseState(GameState):
+    def __init__(self, game):
+        super().__init__(game)
+        self.font = font_registry.get('Arial', 48)
+        self.overlay = None
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game.change_state('play')
@@ -11,9 +18,9 @@ class PauseState(GameState):
 
     def draw(self, surface):
         self.game.draw_gameplay(surface)
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
-        font = pygame.font.SysFont('Arial', 48)
-        text = font.render("PAUSED", True, (255, 255, 255))
+        if self.overlay is None or self.overlay.get_size() != surface.get_size():
+            self.overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, 180))
+        surface.blit(self.overlay, (0, 0))
+        text = text_cache.render(self.font, "PAUSED", True, (255, 255, 255))
         surface.blit(text, (surface.get_width()//2 - text.get_width()//2, surface.get_height()//2 - 40))
\ No newline at end of file
@@ -2,17 +2,18 @@ from .game_state import GameState
 import pygame
 
 class PlayState(GameState):
+    def preload(self):
+        self.game.load_gameplay_assets()
+
     def enter(self):
         self.game.reset_game()
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:  # Tombol +
-                self.game.scale_factor = min(self.game.scale_factor + 0.1, self.game.max_scale)
-                self.game.apply_scale_to_entities()
+                self.game.change_zoom(1)
             elif event.key == pygame.K_MINUS:  # Tombol -
-                self.game.scale_factor = max(self.game.scale_factor - 0.1, self.game.min_scale)
-                self.game.apply_scale_to_entities()
+                self.game.change_zoom(-1)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game.change_state('pause')
         if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
@@ -26,4 +27,5 @@ class PlayState(GameState):
         self.game.update_gameplay()
 
     def draw(self, surface):
-        self.game.draw_gameplay(surface)
\ No newline at end of file
+        # Hanya play state yang boleh memakai dirty rect (state lain menimpa seluruh layar)
+        self.game.draw_gameplay(surface, track_dirty=True)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import deque
+
+
+class StateRegistry:
+    """Daftar state yang baru dibuat saat pertama kali dimasuki, bisa di-prefetch di background"""
+    def __init__(self, game, factories):
+        self.game = game
+        self.factories = dict(factories)
+        self._states = {}
+        self._lock = threading.RLock()
+        self._prefetched = set()
+        self._prefetch_thread = None
+        self._pending = deque()  # state yang menunggu giliran di thread prefetch
+        self._stopping = False
+        # Waktu (detik) yang dipakai tiap state: {'init': ..., 'preload': ...}
+        self.timings = {}
+
+    def __getitem__(self, name):
+        state = self._states.get(name)
+        if state is None:
+            state = self._construct(name)
+        return state
+
+    def __contains__(self, name):
+        return name in self.factories
+
+    def is_loaded(self, name):
+        return name in self._states
+
+    def _construct(self, name):
+        with self._lock:
+            # Cek lagi, mungkin sudah dibuat thread prefetch selama menunggu lock
+            state = self._states.get(name)
+            if state is None:
+                factory = self.factories[name]
+                start = time.perf_counter()
+                state = factory(self.game)
+                self._record(name, 'init', time.perf_counter() - start)
+                self._states[name] = state
+        return state
+
+    def _record(self, name, phase, seconds):
+        self.timings.setdefault(name, {})[phase] = seconds
+
+    def preload(self, name):
+        """Buat state dan load asset-nya sekarang juga"""
+        state = self[name]
+        with self._lock:
+            if name in self._prefetched:
+                return state
+            self._prefetched.add(name)
+        start = time.perf_counter()
+        state.preload()
+        self._record(name, 'preload', time.perf_counter() - start)
+        return state
+
+    def prefetch(self, names):
+        """Preload state yang kemungkinan dimasuki berikutnya di background thread.
+
+        Kalau thread prefetch masih jalan, state baru masuk antrian thread itu.
+        """
+        with self._lock:
+            if self._stopping:
+                return None
+            for name in names:
+                if name in self.factories and name not in self._prefetched and name not in self._pending:
+                    self._pending.append(name)
+            if self._pending and self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(target=self._prefetch_worker, daemon=True)
+                self._prefetch_thread.start()
+            return self._prefetch_thread
+
+    def _prefetch_worker(self):
+        while True:
+            with self._lock:
+                # Keputusan berhenti diambil di bawah lock yang sama dengan prefetch(),
+                # jadi nama yang baru masuk antrian tidak pernah tertinggal
+                if self._stopping or not self._pending:
+                    self._prefetch_thread = None
+                    return
+                name = self._pending.popleft()
+            self.preload(name)
+
+    def shutdown(self):
+        """Batalkan antrian prefetch dan tunggu state yang sedang di-load (panggil sebelum pygame.quit)"""
+        with self._lock:
+            self._stopping = True
+            self._pending.clear()
+            thread = self._prefetch_thread
+        if thread is not None:
+            thread.join()
+
+    def report(self):
+        """Ringkasan biaya startup per state (ms)"""
+        return {name: {phase: seconds * 1000 for phase, seconds in phases.items()}
+                for name, phases in self.timings.items()}
@@ -1,13 +1,15 @@
 from .game_state import GameState
 import pygame
+from src.systems.text_cache import text_cache
+from src.systems.font_registry import font_registry
 
 class TutorialState(GameState):
     def __init__(self, game):
         super().__init__(game)
         # Load fonts
-        self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 32)
-        self.control_font = pygame.font.SysFont('Arial', 28)
+        self.title_font = font_registry.get('Arial', 48, bold=True)
+        self.text_font = font_registry.get('Arial', 32)
+        self.control_font = font_registry.get('Arial', 28)
         
         # Tutorial content
         self.tutorial_pages = [
@@ -51,7 +53,7 @@ class TutorialState(GameState):
         surface.fill((30, 30, 70))
         
         # Draw title
-        title = self.title_font.render("TUTORIAL", True, (255, 215, 0))
+        title = text_cache.render(self.title_font, "TUTORIAL", True, (255, 215, 0))
         surface.blit(title, (surface.get_width()//2 - title.get_width()//2, 80))
         
         # Draw current page content
@@ -59,7 +61,7 @@ class TutorialState(GameState):
         line_spacing = 40
         
         # Draw page indicator
-        page_text = self.text_font.render(
+        page_text = text_cache.render(self.text_font, 
             f"Page {self.current_page + 1}/{len(self.tutorial_pages)}", 
             True, (150, 150, 150))
         surface.blit(page_text, (surface.get_width()//2 - page_text.get_width()//2, 120))
@@ -67,21 +69,21 @@ class TutorialState(GameState):
         # Draw tutorial items
         for i, line in enumerate(self.tutorial_pages[self.current_page]):
             if i == 0:  # Section title
-                text = self.text_font.render(line, True, (255, 255, 255))
+                text = text_cache.render(self.text_font, line, True, (255, 255, 255))
             else:
-                text = self.control_font.render(line, True, (200, 200, 255))
+                text = text_cache.render(self.control_font, line, True, (200, 200, 255))
             surface.blit(text, (surface.get_width()//2 - text.get_width()//2, y_position))
             y_position += line_spacing
         
         # Draw navigation instructions
-        nav_text = self.control_font.render(
+        nav_text = text_cache.render(self.control_font, 
             "Use LEFT/RIGHT arrows to navigate", 
             True, (150, 255, 150))
         surface.blit(nav_text, (surface.get_width()//2 - nav_text.get_width()//2, 
                      surface.get_height() - 80))
         
         # Draw exit instructions
-        exit_text = self.control_font.render(
+        exit_text = text_cache.render(self.control_font, 
             "ENTER/SPACE to return to menu | ESC to exit", 
             True, (200, 150, 150))
         surface.blit(exit_text, (surface.get_width()//2 - exit_text.get_width()//2, 
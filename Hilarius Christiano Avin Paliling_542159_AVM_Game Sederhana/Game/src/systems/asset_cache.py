@@ -0,0 +1,94 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pygame
+from settings import ASSET_CACHE_DIR, ASSET_CACHE_ENABLED
+
+
+class AssetCache:
+    """Cache turunan asset di disk (background ter-scale, grid walkable, frame sprite).
+
+    Key diambil dari path + mtime + ukuran file sumber dan parameter turunannya,
+    jadi kalau PNG sumber diganti, cache otomatis dibuat ulang.
+    """
+    def __init__(self, cache_dir=ASSET_CACHE_DIR, enabled=ASSET_CACHE_ENABLED):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, name, sources, params):
+        digest = hashlib.sha1(name.encode())
+        for source in sources:
+            stat = Path(source).stat()
+            digest.update(f"{Path(source).resolve()}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+        digest.update(repr(params).encode())
+        return f"{name}-{digest.hexdigest()[:16]}"
+
+    def _path(self, name, sources, params):
+        return self.cache_dir / f"{self._key(name, sources, params)}.npy"
+
+    def cached_array(self, name, sources, params, builder):
+        """Ambil array dari cache, atau panggil builder() lalu simpan hasilnya"""
+        if not self.enabled:
+            return builder()
+        try:
+            path = self._path(name, sources, params)
+        except OSError:
+            # File sumber tidak ada, biarkan builder yang menangani error-nya
+            return builder()
+
+        if path.exists():
+            try:
+                array = np.load(path, allow_pickle=False)
+                self.hits += 1
+                return array
+            except (OSError, ValueError):
+                print(f"Asset cache rusak, dibuat ulang: {path.name}")
+
+        self.misses += 1
+        array = builder()
+        self._store(path, array)
+        return array
+
+    def ensure_array(self, name, sources, params, builder):
+        """Pastikan array sudah ada di cache disk tanpa memuatnya ke memori"""
+        if not self.enabled:
+            return
+        try:
+            path = self._path(name, sources, params)
+        except OSError:
+            return
+        if not path.exists():
+            self.misses += 1
+            self._store(path, builder())
+
+    def _store(self, path, array):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array, allow_pickle=False)
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"Gagal menyimpan asset cache {path.name} ({e})")
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+def surface_to_array(surface, fmt):
+    """Pixel surface sebagai array uint8 (h, w, channel)"""
+    w, h = surface.get_size()
+    data = pygame.image.tobytes(surface, fmt)
+    return np.frombuffer(data, dtype=np.uint8).reshape(h, w, len(fmt))
+
+def array_to_surface(array, fmt):
+    h, w = array.shape[:2]
+    surface = pygame.image.frombytes(array.tobytes(), (w, h), fmt)
+    return surface.convert_alpha() if fmt == 'RGBA' else surface.convert()
+
+
+# Satu instance untuk seluruh proses
+asset_cache = AssetCache()
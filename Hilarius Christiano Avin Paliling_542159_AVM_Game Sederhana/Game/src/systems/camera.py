@@ -1,22 +1,38 @@
 import numpy as np
+import pygame
 
 class Camera:
-    def __init__(self, width, height):
+    def __init__(self, width, height, world_width=None, world_height=None):
         self.offset = np.array([0, 0], dtype=float)
         self.width = width
         self.height = height
         self.zoom = 1.0
         self.target = None
-        
+        # Ukuran dunia: X wrap (tidak dibatasi), Y dibatasi supaya tidak keluar dunia
+        self.world_width = world_width
+        self.world_height = world_height
+
     def set_target(self, target):
         self.target = target
-        
+
+    def center_on(self, position):
+        """Hitung offset agar posisi (dunia) berada di tengah layar"""
+        offset = np.array([self.width / 2, self.height / 2]) - position
+        if self.world_height is not None:
+            if self.world_height > self.height:
+                offset[1] = min(max(offset[1], self.height - self.world_height), 0)
+            else:
+                offset[1] = (self.height - self.world_height) / 2
+        self.offset = np.round(offset)
+
     def update(self):
         if self.target is not None:
-            # Hitung offset agar target di tengah layar
-            target_offset = np.array([self.width//2, self.height//2]) - self.target.pos
-            self.offset = target_offset
-            
+            self.center_on(self.target.pos)
+
     def apply(self, position):
         """Apply camera offset ke posisi entity"""
-        return position + self.offset
\ No newline at end of file
+        return position + self.offset
+
+    def viewport(self):
+        """Area dunia yang terlihat di layar (X bisa di luar [0, world_width) karena wrap)"""
+        return pygame.Rect(-int(self.offset[0]), -int(self.offset[1]), self.width, self.height)
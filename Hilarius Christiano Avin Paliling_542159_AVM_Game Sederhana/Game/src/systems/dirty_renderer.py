@@ -0,0 +1,88 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Render play state hanya di area yang berubah, lalu present dengan display.update(rects)"""
+    def __init__(self, width, height, max_dirty_ratio):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.max_dirty_area = width * height * max_dirty_ratio
+        self.previous_rects = []
+        self.current_rects = []
+        self.full_redraw = True
+        self.scrolled = False
+        self.used_this_frame = False
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.scrolls = 0
+
+    def invalidate(self):
+        """Frame berikutnya digambar ulang penuh (mis. setelah state lain menggambar layar)"""
+        self.full_redraw = True
+
+    def scroll(self, surface, dx, dy):
+        """Kamera bergeser (dx, dy) pixel: geser isi frame sebelumnya dengan Surface.scroll.
+
+        Strip yang terbuka di tepi layar dan rect lama (ikut bergeser) digambar ulang oleh
+        restore_background. Seluruh layar berubah, jadi frame ini tetap di-flip penuh.
+        """
+        if self.full_redraw or (dx == 0 and dy == 0):
+            return
+        width, height = self.screen_rect.size
+        if abs(dx) >= width or abs(dy) >= height:
+            self.invalidate()
+            return
+        surface.scroll(dx, dy)
+        rects = [rect.move(dx, dy).clip(self.screen_rect) for rect in self.previous_rects]
+        if dx:
+            rects.append(pygame.Rect(0 if dx > 0 else width + dx, 0, abs(dx), height))
+        if dy:
+            rects.append(pygame.Rect(0, 0 if dy > 0 else height + dy, width, abs(dy)))
+        self.previous_rects = [rect for rect in rects if rect.width and rect.height]
+        self.scrolled = True
+
+    def restore_background(self, draw_background):
+        """Hapus gambar frame sebelumnya dengan menggambar ulang background hanya di rect lama.
+
+        draw_background(area) menggambar background di area layar itu (None = layar penuh).
+        """
+        self.used_this_frame = True
+        self.current_rects = []
+        if self.full_redraw:
+            draw_background(None)
+        else:
+            for rect in self.previous_rects:
+                draw_background(rect)
+
+    def add(self, rects):
+        """Catat rect yang digambar frame ini (hasil Surface.blit / pygame.draw)"""
+        for rect in rects:
+            rect = rect.clip(self.screen_rect)
+            if rect.width and rect.height:
+                self.current_rects.append(rect)
+
+    def present(self):
+        if not self.used_this_frame:
+            # Frame ini bukan dari play state, tampilkan penuh
+            pygame.display.flip()
+            self.invalidate()
+            return
+
+        dirty = self.previous_rects + self.current_rects
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        if self.scrolled:
+            # Isi layar sudah digeser, semua pixel berubah
+            pygame.display.flip()
+            self.scrolls += 1
+        elif self.full_redraw or dirty_area > self.max_dirty_area:
+            # Terlalu banyak area kotor, flip penuh lebih murah
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
+
+        self.full_redraw = False
+        self.scrolled = False
+        self.used_this_frame = False
+        self.previous_rects = self.current_rects
+        self.current_rects = []
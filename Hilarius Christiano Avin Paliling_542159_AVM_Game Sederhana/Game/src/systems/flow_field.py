@@ -0,0 +1,174 @@
+import math
+import numpy as np
+from settings import FLOW_FIELD_CELL_SIZE, FLOW_FIELD_WALKABLE_RATIO, FLOW_FIELD_STEPS_PER_TICK
+
+# 8 arah tetangga (dx, dy), diagonal hanya boleh kalau kedua sisi ortogonalnya walkable
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    """Flow field BFS dari cell player di atas grid walkable kasar, dipakai bersama semua mob.
+
+    Grid kasar diturunkan dari WalkabilityGrid (cell walkable jika cukup banyak pixel-nya walkable).
+    X wrap seperti dunia, Y tidak. BFS dijalankan bertahap (FLOW_FIELD_STEPS_PER_TICK gelombang
+    per tick) hanya saat player pindah cell; selama itu mob tetap memakai field terakhir yang selesai.
+    BFS yang sedang berjalan tidak di-restart, target terbaru diambil setelah BFS itu selesai.
+    """
+    def __init__(self, walk_grid, cell_size=FLOW_FIELD_CELL_SIZE,
+                 walkable_ratio=FLOW_FIELD_WALKABLE_RATIO, steps_per_tick=FLOW_FIELD_STEPS_PER_TICK):
+        self.world_width = walk_grid.width
+        self.world_height = walk_grid.height
+        # Lebar cell dibulatkan agar kolom pas dengan lebar dunia (sama seperti SpatialHash)
+        self.cols = max(1, int(self.world_width // cell_size))
+        self.rows = max(1, int(math.ceil(self.world_height / cell_size)))
+        self.cell_w = self.world_width / self.cols
+        self.cell_h = float(cell_size)
+        self.steps_per_tick = steps_per_tick
+
+        self.walkable = self._coarse_walkable(walk_grid.grid, walkable_ratio)
+        # allowed[k][c]: cell c boleh dicapai dari c - NEIGHBORS[k]
+        self._allowed = [self._step_allowed(dx, dy) for dx, dy in NEIGHBORS]
+        self._unit = np.array([(dx, dy) for dx, dy in NEIGHBORS], dtype=np.float64)
+        self._unit /= np.hypot(self._unit[:, 0], self._unit[:, 1])[:, None]
+
+        # Field aktif: arah (rows, cols, 2), nol = tidak ada info (unreachable / cell target)
+        self.directions = np.zeros((self.rows, self.cols, 2), dtype=np.float64)
+        self._reached = np.empty((self.rows, self.cols), dtype=bool)
+        self._candidate = np.empty((self.rows, self.cols), dtype=bool)
+        self.recomputes = 0
+        self.reset()
+
+    def reset(self):
+        """Buang field dan BFS yang sedang berjalan (mis. saat sesi gameplay baru dimulai)"""
+        self.directions.fill(0)
+        self.distance = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        self.target_cell = None
+        self.wanted_cell = None
+        self.ready = False
+
+        # BFS yang sedang berjalan
+        self._pending_target = None
+        self._pending_distance = None
+        self._frontier = None
+        self._wave = 0
+
+    def _coarse_walkable(self, grid, walkable_ratio):
+        height, width = grid.shape
+        col_of_x = np.minimum((np.arange(width) / self.cell_w).astype(np.intp), self.cols - 1)
+        row_of_y = np.minimum((np.arange(height) / self.cell_h).astype(np.intp), self.rows - 1)
+        col_start = np.searchsorted(col_of_x, np.arange(self.cols))
+        row_start = np.searchsorted(row_of_y, np.arange(self.rows))
+        row_counts = np.add.reduceat(grid.view(np.uint8), row_start, axis=0, dtype=np.int32)
+        counts = np.add.reduceat(row_counts, col_start, axis=1)
+        areas = np.outer(np.diff(np.append(row_start, height)), np.diff(np.append(col_start, width)))
+        return counts >= areas * walkable_ratio
+
+    def _shift(self, grid, dx, dy, fill=False, out=None):
+        """out[y, x] = grid[y - dy, x - dx], X wrap dan Y diisi `fill`"""
+        if out is None:
+            out = np.empty_like(grid)
+        # Baris: geser dy, sisanya diisi fill
+        if dy > 0:
+            dst_rows, src_rows = slice(dy, None), slice(None, -dy)
+            out[:dy] = fill
+        elif dy < 0:
+            dst_rows, src_rows = slice(None, dy), slice(-dy, None)
+            out[dy:] = fill
+        else:
+            dst_rows = src_rows = slice(None)
+        # Kolom: geser dx dengan wrap
+        if dx > 0:
+            out[dst_rows, dx:] = grid[src_rows, :-dx]
+            out[dst_rows, :dx] = grid[src_rows, -dx:]
+        elif dx < 0:
+            out[dst_rows, :dx] = grid[src_rows, -dx:]
+            out[dst_rows, dx:] = grid[src_rows, :-dx]
+        else:
+            out[dst_rows] = grid[src_rows]
+        return out
+
+    def _step_allowed(self, dx, dy):
+        allowed = self.walkable.copy()
+        if dx and dy:
+            # Tidak boleh memotong sudut tembok
+            allowed &= self._shift(self.walkable, 0, dy) & self._shift(self.walkable, dx, 0)
+        return allowed
+
+    def cell_of(self, x, y):
+        cx = int(x // self.cell_w) % self.cols
+        cy = min(max(int(y // self.cell_h), 0), self.rows - 1)
+        return cy, cx
+
+    def set_target(self, x, y):
+        """Catat posisi target (player); BFS baru dimulai di step() jika cell-nya berubah"""
+        self.wanted_cell = self.cell_of(x, y)
+        if not self.ready and self._pending_target is None:
+            # Field pertama dihitung langsung supaya mob tidak jalan tanpa arah
+            self._start(self.wanted_cell)
+            self.step(budget=None)
+
+    def _start(self, cell):
+        self._pending_target = cell
+        self._pending_distance = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        self._pending_distance[cell] = 0
+        self._frontier = np.zeros((self.rows, self.cols), dtype=bool)
+        self._frontier[cell] = True
+        self._wave = 0
+
+    def step(self, budget=-1):
+        """Jalankan sebagian BFS (budget gelombang, None = sampai selesai)"""
+        if self._pending_target is None:
+            if self.wanted_cell is None or self.wanted_cell == self.target_cell:
+                return
+            self._start(self.wanted_cell)
+        if budget == -1:
+            budget = self.steps_per_tick
+        reached, candidate = self._reached, self._candidate
+        distance = self._pending_distance
+        steps = 0
+        while self._frontier.any():
+            if budget is not None and steps >= budget:
+                return
+            reached.fill(False)
+            for (dx, dy), allowed in zip(NEIGHBORS, self._allowed):
+                self._shift(self._frontier, dx, dy, out=candidate)
+                candidate &= allowed
+                reached |= candidate
+            reached &= distance < 0
+            self._wave += 1
+            distance[reached] = self._wave
+            self._frontier, reached = reached, self._frontier
+            self._reached = reached
+            steps += 1
+        self._finish()
+
+    def _finish(self):
+        distance = self._pending_distance
+        unreached = np.iinfo(np.int32).max
+        dist = np.where(distance >= 0, distance, unreached)
+        # Arah tiap cell = tetangga (yang boleh dilewati) dengan jarak terkecil
+        best = np.full(dist.shape, unreached, dtype=np.int32)
+        best_k = np.full(dist.shape, -1, dtype=np.intp)
+        for k, (dx, dy) in enumerate(NEIGHBORS):
+            # Gerak c -> c + d boleh jika c + d bisa dicapai dari c
+            can_move = self._shift(self._allowed[k], -dx, -dy)
+            neighbor = np.where(can_move, self._shift(dist, -dx, -dy, fill=unreached), unreached)
+            better = neighbor < best
+            best[better] = neighbor[better]
+            best_k[better] = k
+        downhill = (best < dist) & (best_k >= 0)
+        self.directions.fill(0)
+        self.directions[downhill] = self._unit[best_k[downhill]]
+        self.distance = distance
+        self.target_cell = self._pending_target
+        self._pending_target = None
+        self._pending_distance = None
+        self._frontier = None
+        self.ready = True
+        self.recomputes += 1
+
+    def lookup(self, xs, ys):
+        """Arah flow (N, 2) untuk posisi dunia (N,), O(1) per posisi"""
+        cx = (np.floor(xs / self.cell_w).astype(np.intp)) % self.cols
+        cy = np.clip(np.floor(ys / self.cell_h).astype(np.intp), 0, self.rows - 1)
+        return self.directions[cy, cx]
@@ -0,0 +1,64 @@
+import threading
+import pygame
+
+
+class FontRegistry:
+    """Tempat pusat untuk font: tiap (family, size, bold) hanya di-resolve dan di-load sekali"""
+    def __init__(self):
+        self._fonts = {}
+        self._lock = threading.Lock()
+        self._warm_thread = None
+        self._stopping = False
+
+    def get(self, family, size, bold=False):
+        """family None = font default pygame, selain itu dicari lewat SysFont"""
+        key = (family, size, bold)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+        with self._lock:
+            # Cek lagi, mungkin sudah di-load thread lain selama menunggu lock
+            font = self._fonts.get(key)
+            if font is None:
+                font = self._load(family, size, bold)
+                self._fonts[key] = font
+        return font
+
+    def _load(self, family, size, bold):
+        if family is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            return font
+        return pygame.font.SysFont(family, size, bold=bold)
+
+    def warm(self, specs):
+        """Load daftar font (family, size, bold) sekarang juga"""
+        for family, size, bold in specs:
+            self.get(family, size, bold)
+
+    def warm_async(self, specs):
+        """Load daftar font di background thread supaya tidak menahan frame pertama"""
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return self._warm_thread
+        self._warm_thread = threading.Thread(target=self._warm_worker, args=(list(specs),), daemon=True)
+        self._warm_thread.start()
+        return self._warm_thread
+
+    def _warm_worker(self, specs):
+        for family, size, bold in specs:
+            if self._stopping:
+                return
+            self.get(family, size, bold)
+
+    def shutdown(self):
+        """Hentikan warm-up font dan tunggu thread-nya selesai (panggil sebelum pygame.quit)"""
+        self._stopping = True
+        thread = self._warm_thread
+        if thread is not None:
+            thread.join()
+        self._warm_thread = None
+        self._stopping = False
+
+
+# Satu instance untuk seluruh proses
+font_registry = FontRegistry()
@@ -0,0 +1,145 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+from settings import (PROFILER_ENABLED, PROFILER_HISTORY, PROFILER_OVERLAY_REFRESH,
+                      PROFILER_DUMP_DIR, FPS, WHITE)
+from src.systems.font_registry import font_registry
+
+
+class FrameProfiler:
+    """Catat waktu tiap fase Game.run ke ring buffer ukuran tetap (satu baris per frame render).
+
+    lap(phase) menambahkan waktu sejak lap sebelumnya ke fase itu, jadi fase yang dipanggil
+    berkali-kali dalam satu frame (mis. beberapa tick simulasi) otomatis dijumlahkan.
+    Saat disabled semua method langsung return, biayanya hanya satu pemanggilan method.
+    """
+    EVENTS, UPDATE, COLLISION, DRAW, FLIP = range(5)
+    PHASES = ('events', 'update', 'collision', 'draw', 'flip')
+    COUNTERS = ('mobs', 'projectiles', 'drawn', 'culled', 'tiles')
+    # Kolom buffer: dt (interval clock.tick), waktu per fase (ms), lalu jumlah entitas
+    COLUMNS = ('dt',) + PHASES + COUNTERS
+
+    def __init__(self, enabled=PROFILER_ENABLED, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.history = history
+        self.data = np.zeros((history, len(self.COLUMNS)))
+        self.frames = 0  # total frame yang tercatat (index tulis = frames % history)
+        self._current = [0.0] * len(self.PHASES)
+        self._dt = 0.0
+        self._last = time.perf_counter()
+        self._panel = None
+        self._panel_frame = -PROFILER_OVERLAY_REFRESH
+
+    def begin_frame(self, dt_ms):
+        if not self.enabled:
+            return
+        self._dt = dt_ms
+        self._current[:] = (0.0,) * len(self.PHASES)
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[phase] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self, counts):
+        """Simpan frame ini ke ring buffer, counts sesuai urutan COUNTERS"""
+        if not self.enabled:
+            return
+        row = self.data[self.frames % self.history]
+        row[0] = self._dt
+        row[1:1 + len(self.PHASES)] = self._current
+        row[1 + len(self.PHASES):] = counts
+        self.frames += 1
+
+    def samples(self):
+        """Isi buffer urut dari frame terlama ke terbaru"""
+        if self.frames < self.history:
+            return self.data[:self.frames]
+        start = self.frames % self.history
+        return np.concatenate((self.data[start:], self.data[:start]))
+
+    def summary(self):
+        """p50/p99 waktu kerja per frame (jumlah semua fase) dan rata-rata tiap fase (ms)"""
+        samples = self.samples()
+        if not len(samples):
+            return None
+        work = samples[:, 1:1 + len(self.PHASES)].sum(axis=1)
+        return {
+            'frames': len(samples),
+            'p50': float(np.percentile(work, 50)),
+            'p99': float(np.percentile(work, 99)),
+            'dt_p50': float(np.percentile(samples[:, 0], 50)),
+            'dt_p99': float(np.percentile(samples[:, 0], 99)),
+            'phases': {phase: float(samples[:, 1 + i].mean()) for i, phase in enumerate(self.PHASES)},
+            'counts': {name: int(samples[-1, 1 + len(self.PHASES) + i])
+                       for i, name in enumerate(self.COUNTERS)},
+        }
+
+    def dump_csv(self, path=None):
+        """Tulis isi buffer ke CSV, return path file-nya"""
+        if path is None:
+            PROFILER_DUMP_DIR.mkdir(parents=True, exist_ok=True)
+            path = PROFILER_DUMP_DIR / f"frames-{time.strftime('%Y%m%d-%H%M%S')}.csv"
+        samples = self.samples()
+        first = self.frames - len(samples)
+        table = np.column_stack((np.arange(first, self.frames), samples))
+        # Waktu dalam ms, frame dan jumlah entitas bilangan bulat
+        fmt = ['%d'] + ['%.3f'] * (1 + len(self.PHASES)) + ['%d'] * len(self.COUNTERS)
+        np.savetxt(path, table, delimiter=',', fmt=fmt, comments='',
+                   header=','.join(('frame',) + self.COLUMNS))
+        return Path(path)
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self._panel_frame = -PROFILER_OVERLAY_REFRESH
+
+    def draw_overlay(self, surface):
+        """Gambar panel profiler di pojok kanan atas, return rect-nya (None jika tidak tampil)"""
+        if not (self.enabled and self.overlay_visible):
+            return None
+        # Panel disusun ulang tiap beberapa frame saja, angka yang berubah tiap frame tidak terbaca
+        if self._panel is None or self.frames - self._panel_frame >= PROFILER_OVERLAY_REFRESH:
+            self._panel = self._build_panel()
+            self._panel_frame = self.frames
+        return surface.blit(self._panel, (surface.get_width() - self._panel.get_width() - 10, 10))
+
+    def _build_panel(self):
+        width, height, graph_h = 260, 200, 60
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        font = font_registry.get(None, 20)
+        summary = self.summary()
+        if summary is None:
+            panel.blit(font.render("profiler: belum ada data", True, WHITE), (8, 8))
+            return panel
+
+        phases = summary['phases']
+        counts = summary['counts']
+        lines = [
+            f"work p50 {summary['p50']:.2f} ms  p99 {summary['p99']:.2f} ms",
+            f"frame p50 {summary['dt_p50']:.1f} ms  p99 {summary['dt_p99']:.1f} ms",
+            "  ".join(f"{phase[:4]} {phases[phase]:.2f}" for phase in self.PHASES[:3]),
+            "  ".join(f"{phase[:4]} {phases[phase]:.2f}" for phase in self.PHASES[3:]),
+            f"mobs {counts['mobs']}  proj {counts['projectiles']}  tiles {counts['tiles']}",
+            f"drawn {counts['drawn']}  culled {counts['culled']}",
+        ]
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, WHITE), (8, 6 + i * 18))
+
+        # Grafik waktu kerja per frame, garis kuning = budget 1 frame pada FPS target
+        samples = self.samples()
+        work = samples[:, 1:1 + len(self.PHASES)].sum(axis=1)[-(width - 16):]
+        top = height - graph_h - 6
+        scale = graph_h / max(work.max(), 1000 / 30)
+        budget_y = top + graph_h - (1000 / FPS) * scale
+        pygame.draw.line(panel, (255, 215, 0), (8, budget_y), (width - 8, budget_y))
+        if len(work) > 1:
+            points = [(8 + i, top + graph_h - value * scale) for i, value in enumerate(work)]
+            pygame.draw.lines(panel, (0, 255, 0), False, points)
+        return panel
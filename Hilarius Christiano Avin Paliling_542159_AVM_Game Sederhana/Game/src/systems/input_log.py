@@ -0,0 +1,89 @@
+import struct
+import time
+
+import numpy as np
+import pygame
+from settings import INPUT_RECORD_DIR
+
+# Tombol yang dibaca Player.update, urutan = bit di mask (bit 15 = tombol serang)
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_LSHIFT,
+                 pygame.K_q, pygame.K_e, pygame.K_h, pygame.K_v)
+KEY_BITS = {key: 1 << bit for bit, key in enumerate(RECORDED_KEYS)}
+ATTACK_BIT = 1 << 15
+
+MAGIC = b'SHIN'
+VERSION = 1
+# Header: magic, versi, seed RNG sesi; lalu satu record per tick: mask tombol, index level zoom
+HEADER = struct.Struct('<4sHQ')
+TICK = struct.Struct('<HB')
+TICK_DTYPE = np.dtype([('mask', '<u2'), ('zoom', 'u1')])
+
+
+class RecordedKeys:
+    """Pengganti pygame.key.get_pressed() dari mask tombol hasil rekaman"""
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+def encode_input(keys, attack):
+    mask = ATTACK_BIT if attack else 0
+    for key, bit in KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+
+class InputRecorder:
+    """Tulis input tiap tick gameplay ke log biner (3 byte per tick)"""
+    def __init__(self, path, seed):
+        self.path = path
+        self.ticks = 0
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    @classmethod
+    def start_new(cls, seed):
+        """Rekaman baru di INPUT_RECORD_DIR, nama file dari waktu mulai dan seed sesi"""
+        INPUT_RECORD_DIR.mkdir(parents=True, exist_ok=True)
+        name = f"session-{time.strftime('%Y%m%d-%H%M%S')}-{seed & 0xffffffff:08x}.input"
+        return cls(INPUT_RECORD_DIR / name, seed)
+
+    def record(self, keys, attack, zoom_index):
+        self._file.write(TICK.pack(encode_input(keys, attack), zoom_index))
+        self.ticks += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class InputReplay:
+    """Baca log rekaman dan kembalikan input yang sama tick demi tick"""
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, self.seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} bukan log input versi {VERSION}")
+        body = memoryview(data)[HEADER.size:]
+        # Record terakhir bisa terpotong kalau game berhenti paksa, abaikan saja
+        usable = len(body) - len(body) % TICK_DTYPE.itemsize
+        self.ticks = np.frombuffer(body[:usable], dtype=TICK_DTYPE)
+        self.position = 0
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @property
+    def finished(self):
+        return self.position >= len(self.ticks)
+
+    def next_input(self):
+        """(keys, tombol serang, index level zoom) untuk tick berikutnya"""
+        mask, zoom_index = self.ticks[self.position]
+        self.position += 1
+        mask = int(mask)
+        return RecordedKeys(mask), bool(mask & ATTACK_BIT), int(zoom_index)
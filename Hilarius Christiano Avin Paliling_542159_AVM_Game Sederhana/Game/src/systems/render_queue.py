@@ -0,0 +1,72 @@
+from operator import itemgetter
+import pygame
+
+
+class RenderQueue:
+    """Antrian blit per frame: di-cull terhadap viewport, diurutkan y, lalu digambar dengan satu Surface.blits.
+
+    Layer SPRITES diurutkan berdasarkan sort_y (entitas lebih bawah menutupi yang di atasnya),
+    layer OVERLAY (health bar dll) digambar setelahnya sesuai urutan submit.
+    """
+    SPRITES, OVERLAY = 0, 1
+
+    def __init__(self, width, height):
+        self.viewport = pygame.Rect(0, 0, width, height)
+        self._sprites = []
+        self._overlay = []
+        self.submitted = 0
+        self.culled = 0
+
+    def clear(self):
+        self._sprites.clear()
+        self._overlay.clear()
+        self.submitted = 0
+        self.culled = 0
+
+    def visible_mask(self, left, top, right, bottom):
+        """Versi batch untuk cull: box (array layar) yang bersinggungan dengan viewport"""
+        view = self.viewport
+        return (right > view.left) & (left < view.right) & (bottom > view.top) & (top < view.bottom)
+
+    def add_culled(self, count):
+        """Catat entitas yang sudah di-cull sendiri lewat visible_mask (tidak pernah di-submit)"""
+        self.submitted += count
+        self.culled += count
+
+    def submit(self, image, dest, sort_y=0, area=None, layer=SPRITES):
+        """Tambah satu blit (dest = pojok kiri atas di layar), return False jika di luar viewport"""
+        self.submitted += 1
+        if area is None:
+            w, h = image.get_size()
+        else:
+            w, h = area[2], area[3]
+        x, y = dest
+        view = self.viewport
+        if w <= 0 or h <= 0 or x + w <= view.left or x >= view.right or y + h <= view.top or y >= view.bottom:
+            self.culled += 1
+            return False
+        item = (image, dest) if area is None else (image, dest, area)
+        if layer == self.SPRITES:
+            self._sprites.append((sort_y, item))
+        else:
+            self._overlay.append(item)
+        return True
+
+    def flush(self, surface):
+        """Gambar semua item dalam satu Surface.blits, return list rect yang digambar"""
+        # sort stabil: item dengan y sama tetap sesuai urutan submit
+        self._sprites.sort(key=itemgetter(0))
+        sequence = [item for _, item in self._sprites]
+        sequence.extend(self._overlay)
+        self._sprites.clear()
+        self._overlay.clear()
+        if not sequence:
+            return []
+        return surface.blits(sequence)
+
+    def stats(self):
+        return {
+            'submitted': self.submitted,
+            'culled': self.culled,
+            'drawn': self.submitted - self.culled,
+        }
@@ -0,0 +1,116 @@
+import math
+import numpy as np
+from src.utils.collision import circle_pairs_collision
+
+
+class SpatialHash:
+    """Broad phase grid seragam untuk dunia yang X-nya wrap-around (pos[0] % world_width)"""
+    def __init__(self, cell_size, world_width, world_height):
+        self.world_width = world_width
+        self.world_height = world_height
+        # Lebar cell dibulatkan ke atas agar kolom pas dengan lebar dunia (penting untuk wrap)
+        self.cols = max(1, int(world_width // cell_size))
+        self.rows = max(1, int(math.ceil(world_height / cell_size)))
+        self.cell_w = world_width / self.cols
+        self.cell_h = float(cell_size)
+
+        self.positions = np.zeros((0, 2))
+        self.order = np.zeros(0, dtype=np.intp)
+        self.cell_start = np.zeros(self.cols * self.rows + 1, dtype=np.intp)
+
+    def _cell_coords(self, positions):
+        cx = (np.floor(positions[:, 0] / self.cell_w).astype(np.intp)) % self.cols
+        cy = np.clip(np.floor(positions[:, 1] / self.cell_h).astype(np.intp), 0, self.rows - 1)
+        return cx, cy
+
+    def build(self, positions):
+        """Bangun ulang grid dari array posisi (N,2), O(N log N) lewat sort key cell"""
+        self.positions = positions
+        cx, cy = self._cell_coords(positions)
+        keys = cy * self.cols + cx
+        self.order = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys, minlength=self.cols * self.rows)
+        self.cell_start[0] = 0
+        np.cumsum(counts, out=self.cell_start[1:])
+
+    def query(self, points, reach, max_per_cell=None):
+        """Pasangan kandidat (index point, index item) dalam jangkauan `reach` (belum dicek jarak).
+
+        max_per_cell membatasi item yang diambil dari tiap cell, jadi kandidat per point tetap
+        terbatas walaupun banyak item menumpuk di satu cell. Tiap point mulai dari posisi berbeda
+        di dalam cell supaya tidak semuanya melihat item yang sama.
+        """
+        empty = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+        if len(points) == 0 or len(self.order) == 0:
+            return empty
+
+        qx, qy = self._cell_coords(points)
+        span_x = int(math.ceil(reach / self.cell_w))
+        span_y = int(math.ceil(reach / self.cell_h))
+        if 2 * span_x + 1 >= self.cols:
+            # Semua kolom tercakup, hindari kolom dobel akibat wrap
+            col_offsets = [(c, True) for c in range(self.cols)]
+        else:
+            col_offsets = [(c, False) for c in range(-span_x, span_x + 1)]
+
+        point_ids = np.arange(len(points))
+        query_parts, start_parts, count_parts = [], [], []
+        for dy in range(-span_y, span_y + 1):
+            row = qy + dy
+            valid = (row >= 0) & (row < self.rows)
+            if not valid.any():
+                continue
+            for col, absolute in col_offsets:
+                cols = np.full_like(qx, col) if absolute else (qx + col) % self.cols
+                keys = row[valid] * self.cols + cols[valid]
+                starts = self.cell_start[keys]
+                counts = self.cell_start[keys + 1] - starts
+                query_parts.append(point_ids[valid])
+                start_parts.append(starts)
+                count_parts.append(counts)
+
+        if not query_parts:
+            return empty
+        query_ids = np.concatenate(query_parts)
+        starts = np.concatenate(start_parts)
+        counts = np.concatenate(count_parts)
+        cell_counts = None
+        if max_per_cell is not None and counts.max(initial=0) > max_per_cell:
+            cell_counts = counts
+            counts = np.minimum(cell_counts, max_per_cell)
+        total = counts.sum()
+        if total == 0:
+            return empty
+
+        # Ekspansi range [start, start+count) tiap cell tanpa loop Python
+        run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        if cell_counts is not None:
+            # Jendela max_per_cell item, digeser sesuai index point dan wrap di dalam cell
+            full = np.repeat(cell_counts, counts)
+            run_offsets = (run_offsets + np.repeat(query_ids, counts)) % full
+        items = self.order[np.repeat(starts, counts) + run_offsets]
+        return np.repeat(query_ids, counts), items
+
+    def neighbor_pairs(self, reach, max_per_cell):
+        """Pasangan item (i, j) dalam grid yang berjarak < reach (i != j), beserta delta pos[j] - pos[i]
+        (X lewat jalur wrap terpendek) dan jaraknya. Kandidat per item dibatasi max_per_cell per cell."""
+        query_ids, items = self.query(self.positions, reach, max_per_cell)
+        delta = self.positions[items] - self.positions[query_ids]
+        delta[:, 0] -= np.round(delta[:, 0] / self.world_width) * self.world_width
+        dist_sq = delta[:, 0] ** 2 + delta[:, 1] ** 2
+        keep = (query_ids != items) & (dist_sq < reach * reach)
+        return query_ids[keep], items[keep], delta[keep], np.sqrt(dist_sq[keep])
+
+    def overlapping_pairs(self, points, radii, item_radii):
+        """Broad phase + narrow phase jarak kuadrat, return pasangan yang benar-benar overlap"""
+        if len(points) == 0 or len(self.order) == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        radii = np.broadcast_to(radii, (len(points),))
+        reach = float(radii.max()) + float(np.max(item_radii))
+        query_ids, items = self.query(points, reach)
+        if len(items) == 0:
+            return query_ids, items
+        hit = circle_pairs_collision(points[query_ids], radii[query_ids],
+                                     self.positions[items], item_radii[items],
+                                     wrap_width=self.world_width)
+        return query_ids[hit], items[hit]
@@ -0,0 +1,111 @@
+import numpy as np
+from settings import SPAWN_CELL_SIZE, SPAWN_ANNULUS_TRIES
+
+
+class SpawnSampler:
+    """Index semua pixel walkable untuk memilih posisi spawn tanpa rejection loop tak terbatas.
+
+    Pixel walkable dikelompokkan per cell (SPAWN_CELL_SIZE persegi): tiap entry hanya menyimpan
+    offset lokal di dalam cell (uint16) dan cell_start[c] menunjuk entry pertama cell c.
+    Sampling seragam = pilih satu entry acak, sampling di annulus sekitar titik = pilih cell
+    kandidat (berbobot jumlah pixel walkable) lalu entry di dalamnya. X wrap seperti dunia, Y tidak.
+    """
+    def __init__(self, walk_grid, cell_size=SPAWN_CELL_SIZE):
+        grid = walk_grid.grid
+        self.world_width = walk_grid.width
+        self.world_height = walk_grid.height
+        self.cell_size = cell_size
+        self.cols = -(-self.world_width // cell_size)
+        self.rows = -(-self.world_height // cell_size)
+
+        # Pad ke kelipatan cell lalu susun (rows, cols, cs, cs): flatnonzero langsung urut per cell
+        padded = np.zeros((self.rows * cell_size, self.cols * cell_size), dtype=bool)
+        padded[:self.world_height, :self.world_width] = grid
+        blocks = padded.reshape(self.rows, cell_size, self.cols, cell_size).swapaxes(1, 2)
+        index = np.flatnonzero(blocks)
+        cell_area = cell_size * cell_size
+        self.local = (index % cell_area).astype(np.uint16)
+        counts = np.bincount(index // cell_area, minlength=self.rows * self.cols)
+        self.counts = counts
+        self.cell_start = np.zeros(len(counts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.cell_start[1:])
+        self.total = int(self.cell_start[-1])
+
+        # Pojok kiri atas dan pusat tiap cell (urutan sama dengan counts)
+        rows, cols = np.divmod(np.arange(self.rows * self.cols), self.cols)
+        self._cell_x = cols * cell_size
+        self._cell_y = rows * cell_size
+        self._center_x = self._cell_x + cell_size / 2
+        self._center_y = self._cell_y + cell_size / 2
+
+    def _positions(self, rng, entries):
+        """Posisi dunia (acak di dalam pixel-nya) untuk array index entry"""
+        cells = np.searchsorted(self.cell_start, entries, side='right') - 1
+        local_y, local_x = np.divmod(self.local[entries].astype(np.intp), self.cell_size)
+        xs = self._cell_x[cells] + local_x + rng.random(len(entries))
+        ys = self._cell_y[cells] + local_y + rng.random(len(entries))
+        return xs, ys
+
+    def sample(self, rng):
+        """Posisi walkable acak seragam di seluruh dunia, None jika tidak ada pixel walkable"""
+        if self.total == 0:
+            return None
+        xs, ys = self._positions(rng, rng.integers(self.total, size=1))
+        return float(xs[0]), float(ys[0])
+
+    def _wrapped_dx(self, xs, x):
+        return (xs - x + self.world_width / 2) % self.world_width - self.world_width / 2
+
+    def annulus_cells(self, x, y, r_min, r_max):
+        """Cell berisi pixel walkable yang bersinggungan dengan annulus [r_min, r_max] di sekitar (x, y)"""
+        half = self.cell_size / 2
+        dx = np.abs(self._wrapped_dx(self._center_x, x))
+        dy = np.abs(self._center_y - y)
+        near = np.hypot(np.maximum(dx - half, 0), np.maximum(dy - half, 0))
+        far = np.hypot(dx + half, dy + half)
+        return np.flatnonzero((near <= r_max) & (far >= r_min) & (self.counts > 0))
+
+    def sample_annulus(self, rng, x, y, r_min, r_max, tries=SPAWN_ANNULUS_TRIES):
+        """Posisi walkable acak dengan jarak [r_min, r_max] dari (x, y).
+
+        Biaya terbatas: beberapa percobaan acak dari cell kandidat, lalu (jarang) cek semua pixel
+        di cell kandidat. Jika annulus sama sekali tidak punya pixel walkable, pakai sample().
+        """
+        cells = self.annulus_cells(x, y, r_min, r_max)
+        if len(cells) == 0:
+            return self.sample(rng)
+        counts = self.counts[cells]
+        cumulative = np.cumsum(counts)
+
+        # Percobaan acak: pilih cell berbobot jumlah pixel, lalu pixel di dalamnya
+        picks = rng.integers(cumulative[-1], size=tries)
+        slots = np.searchsorted(cumulative, picks, side='right')
+        entries = self.cell_start[cells[slots]] + picks - (cumulative[slots] - counts[slots])
+        xs, ys = self._positions(rng, entries)
+        inside = self._in_annulus(xs, ys, x, y, r_min, r_max)
+        if inside.any():
+            first = np.argmax(inside)
+            return float(xs[first]), float(ys[first])
+
+        # Semua percobaan meleset (annulus tipis): pilih dari semua pixel di cell kandidat
+        cell_of_entry = np.repeat(cells, counts)
+        entries = (np.repeat(self.cell_start[cells] - (cumulative - counts), counts)
+                   + np.arange(cumulative[-1]))
+        local_y, local_x = np.divmod(self.local[entries].astype(np.intp), self.cell_size)
+        xs = self._cell_x[cell_of_entry] + local_x + 0.5
+        ys = self._cell_y[cell_of_entry] + local_y + 0.5
+        valid = np.flatnonzero(self._in_annulus(xs, ys, x, y, r_min, r_max))
+        if len(valid) == 0:
+            return self.sample(rng)
+        choice = valid[rng.integers(len(valid))]
+        return float(xs[choice]), float(ys[choice])
+
+    def _in_annulus(self, xs, ys, x, y, r_min, r_max):
+        dist = np.hypot(self._wrapped_dx(xs, x), ys - y)
+        return (dist >= r_min) & (dist <= r_max)
+
+    def stats(self):
+        return {
+            'walkable': self.total,
+            'cells': int(np.count_nonzero(self.counts)),
+        }
@@ -0,0 +1,132 @@
+import threading
+from collections import deque
+import numpy as np
+import pygame
+from src.systems.asset_cache import asset_cache, surface_to_array, array_to_surface
+
+
+class SpriteCache:
+    """Cache sprite sheet yang sudah dipotong per frame, dipakai bersama oleh semua entitas"""
+    def __init__(self):
+        self._frames = {}
+        self._pixels = {}  # pixel RGBA frame asli per sheet, sumber untuk versi ter-scale
+        self._lock = threading.RLock()
+        self._warm_thread = None
+        self._warm_jobs = deque()  # job yang menunggu giliran di thread warm
+        self._stopping = False
+        self.hits = 0
+        self.misses = 0
+
+    def load_frames(self, path, frame_w, frame_h, num_frames=None, size=None):
+        """Ambil frame dari sheet (dimuat sekali per proses), opsional di-scale ke `size`.
+
+        Hasilnya tuple yang dipakai bersama, jadi jangan diubah isinya.
+        """
+        path = str(path)
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == (frame_w, frame_h):
+                size = None
+        key = (path, frame_w, frame_h, num_frames, size)
+        frames = self._frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        with self._lock:
+            # Cek lagi, mungkin sudah dibuat thread warm selama menunggu lock
+            frames = self._frames.get(key)
+            if frames is not None:
+                self.hits += 1
+                return frames
+            self.misses += 1
+            if size is None:
+                frames = self._slice_sheet(path, frame_w, frame_h, num_frames)
+            else:
+                # Scale dari pixel frame asli, bukan dari hasil scale sebelumnya. Surface asli
+                # tidak disentuh karena bisa sedang di-blit main thread (smoothscale me-lock source)
+                self.load_frames(path, frame_w, frame_h, num_frames)
+                base = self._pixels[(path, frame_w, frame_h, num_frames)]
+                frames = tuple(pygame.transform.smoothscale(array_to_surface(frame, 'RGBA'), size)
+                               for frame in base)
+            self._frames[key] = frames
+        return frames
+
+    def warm(self, jobs):
+        """Build daftar frame (path, frame_w, frame_h, num_frames, size) sekarang juga"""
+        for path, frame_w, frame_h, num_frames, size in jobs:
+            self.load_frames(path, frame_w, frame_h, num_frames, size)
+
+    def warm_async(self, jobs):
+        """Build daftar frame di background thread (mis. semua level zoom sebelum dipakai).
+
+        Kalau thread warm masih jalan, job baru masuk antrian thread itu.
+        """
+        with self._lock:
+            if self._stopping:
+                return None
+            self._warm_jobs.extend(jobs)
+            if self._warm_jobs and self._warm_thread is None:
+                self._warm_thread = threading.Thread(target=self._warm_worker, daemon=True)
+                self._warm_thread.start()
+            return self._warm_thread
+
+    def _warm_worker(self):
+        while True:
+            with self._lock:
+                # Berhenti di bawah lock yang sama dengan warm_async, job baru tidak tertinggal
+                if self._stopping or not self._warm_jobs:
+                    self._warm_thread = None
+                    return
+                job = self._warm_jobs.popleft()
+            self.warm([job])
+
+    def shutdown(self):
+        """Batalkan antrian warm dan tunggu job yang sedang jalan (panggil sebelum pygame.quit)"""
+        with self._lock:
+            self._stopping = True
+            self._warm_jobs.clear()
+            thread = self._warm_thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._stopping = False
+
+    def _slice_sheet(self, path, frame_w, frame_h, num_frames):
+        # Frame yang sudah dipotong disimpan mentah di asset cache (tanpa decode PNG)
+        pixels = asset_cache.cached_array(
+            'frames', [path], (frame_w, frame_h, num_frames),
+            lambda: self._slice_sheet_pixels(path, frame_w, frame_h, num_frames))
+        self._pixels[(path, frame_w, frame_h, num_frames)] = pixels
+        return tuple(array_to_surface(frame, 'RGBA') for frame in pixels)
+
+    def _slice_sheet_pixels(self, path, frame_w, frame_h, num_frames):
+        sheet = pygame.image.load(path).convert_alpha()
+        max_frames = sheet.get_width() // frame_w
+        if num_frames is None or num_frames > max_frames:
+            num_frames = max_frames
+        frames = [
+            surface_to_array(sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h)), 'RGBA')
+            for i in range(num_frames)
+        ]
+        return np.stack(frames) if frames else np.zeros((0, frame_h, frame_w, 4), dtype=np.uint8)
+
+    def stats(self):
+        """Statistik cache untuk debugging"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._frames),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._frames.clear()
+        self._pixels.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Satu instance untuk seluruh proses
+sprite_cache = SpriteCache()
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from settings import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """LRU cache hasil font.render, dipakai bersama oleh semua state"""
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Sama seperti font.render(text, antialias, color), tapi hasilnya di-cache"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def stats(self):
+        """Statistik cache untuk debugging"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Satu instance untuk seluruh proses
+text_cache = TextCache()
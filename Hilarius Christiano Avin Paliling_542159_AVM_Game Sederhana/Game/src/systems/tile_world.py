@@ -0,0 +1,125 @@
+import math
+import pygame
+from settings import (WORLD_SCALE, WORLD_TILE_SIZE, WORLD_TILE_PREFETCH_MARGIN,
+                      WORLD_TILE_KEEP_MARGIN, WORLD_TILE_LOADS_PER_FRAME)
+from src.systems.asset_cache import asset_cache, surface_to_array, array_to_surface
+
+
+class TileWorld:
+    """Background dunia resolusi penuh, dipotong jadi tile dan di-stream sesuai posisi kamera.
+
+    Tile di-bake sekali ke asset cache di disk, jadi gambar penuh hanya di-decode saat
+    cache belum ada. Saat main hanya tile di sekitar viewport yang ada di memori.
+    X dunia wrap (sama seperti gerak player dan mob), Y tidak.
+    """
+    def __init__(self, path, scale=WORLD_SCALE, tile_size=WORLD_TILE_SIZE):
+        self.path = path
+        self.scale = scale
+        self.tile_size = tile_size
+        self._image = None
+        self._tiles = {}
+        self.loads = 0
+        self.evictions = 0
+
+        size = asset_cache.cached_array('world_size', [path], scale,
+                                        lambda: list(self.world_image().get_size()))
+        self.width, self.height = int(size[0]), int(size[1])
+        self.cols = math.ceil(self.width / tile_size)
+        self.rows = math.ceil(self.height / tile_size)
+        # Streaming butuh cache disk, tanpa itu gambar penuh tetap di memori
+        self.streaming = asset_cache.enabled
+        if self.streaming:
+            for row in range(self.rows):
+                for col in range(self.cols):
+                    asset_cache.ensure_array(*self._tile_key(col, row),
+                                             lambda col=col, row=row: self._tile_pixels(col, row))
+            self._image = None  # gambar penuh tidak dibutuhkan lagi
+
+    def world_image(self):
+        """Gambar dunia ukuran penuh (hanya di-decode kalau memang perlu)"""
+        if self._image is None:
+            image = pygame.image.load(self.path).convert()
+            if self.scale != 1:
+                size = (int(image.get_width() * self.scale), int(image.get_height() * self.scale))
+                image = pygame.transform.smoothscale(image, size)
+            self._image = image
+        return self._image
+
+    def _tile_rect(self, col, row):
+        x = col * self.tile_size
+        y = row * self.tile_size
+        return pygame.Rect(x, y, min(self.tile_size, self.width - x), min(self.tile_size, self.height - y))
+
+    def _tile_key(self, col, row):
+        return 'world_tile', [self.path], (self.scale, self.tile_size, col, row)
+
+    def _tile_pixels(self, col, row):
+        return surface_to_array(self.world_image().subsurface(self._tile_rect(col, row)), 'RGB')
+
+    def tile(self, col, row):
+        surface = self._tiles.get((col, row))
+        if surface is None:
+            if self.streaming:
+                pixels = asset_cache.cached_array(*self._tile_key(col, row),
+                                                  lambda: self._tile_pixels(col, row))
+                surface = array_to_surface(pixels, 'RGB')
+            else:
+                surface = self.world_image().subsurface(self._tile_rect(col, row))
+            self._tiles[(col, row)] = surface
+            self.loads += 1
+        return surface
+
+    def _visible_tiles(self, view, margin=0):
+        """(col, row, x layar, y layar) untuk tile yang bersinggungan dengan view (rect dunia)"""
+        ts = self.tile_size
+        row0 = max(view.top // ts - margin, 0)
+        row1 = min((view.bottom - 1) // ts + margin, self.rows - 1)
+        # X wrap: tile dari periode dunia sebelah kiri/kanan juga bisa terlihat
+        for period in range(math.floor((view.left - margin * ts) / self.width),
+                            math.floor((view.right - 1 + margin * ts) / self.width) + 1):
+            base = period * self.width
+            col0 = max((view.left - base) // ts - margin, 0)
+            col1 = min((view.right - 1 - base) // ts + margin, self.cols - 1)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    yield col, row, base + col * ts - view.left, row * ts - view.top
+
+    def draw(self, surface, offset, area=None):
+        """Gambar tile yang terlihat; area (rect layar) membatasi bagian yang digambar ulang"""
+        area = surface.get_rect() if area is None else pygame.Rect(area)
+        view = area.move(-int(offset[0]), -int(offset[1]))
+        if view.top < 0 or view.bottom > self.height:
+            # Di luar dunia secara vertikal
+            surface.fill((0, 0, 0), area)
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(area)
+        surface.blits([(self.tile(col, row), (area.x + x, area.y + y))
+                       for col, row, x, y in self._visible_tiles(view)], doreturn=False)
+        surface.set_clip(previous_clip)
+
+    def stream(self, offset, view_size):
+        """Load tile di sekitar viewport lebih awal, lepas tile yang sudah jauh dari kamera"""
+        view = pygame.Rect(-int(offset[0]), -int(offset[1]), *view_size)
+        loads = 0
+        for col, row, _, _ in self._visible_tiles(view, WORLD_TILE_PREFETCH_MARGIN):
+            if (col, row) not in self._tiles:
+                self.tile(col, row)
+                loads += 1
+                if loads >= WORLD_TILE_LOADS_PER_FRAME:
+                    break
+
+        if not self.streaming:
+            return
+        keep = {(col, row) for col, row, _, _ in self._visible_tiles(view, WORLD_TILE_KEEP_MARGIN)}
+        for key in [key for key in self._tiles if key not in keep]:
+            del self._tiles[key]
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            'resident': len(self._tiles),
+            'total': self.cols * self.rows,
+            'loads': self.loads,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+import pygame
+from settings import TRANSFORM_CACHE_BUDGET, TRANSFORM_CACHE_ANGLE_STEP
+
+
+class TransformCache:
+    """LRU cache frame hasil flip/rotate, dibatasi total ukuran memori (byte)"""
+    def __init__(self, max_bytes=TRANSFORM_CACHE_BUDGET, angle_step=TRANSFORM_CACHE_ANGLE_STEP):
+        self.max_bytes = max_bytes
+        self.angle_step = angle_step
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize_angle(self, angle):
+        return (round(angle / self.angle_step) * self.angle_step) % 360
+
+    def get(self, frame, flip_horizontal, flip_vertical, angle):
+        """Frame yang sudah di-flip lalu di-rotate (urutan sama seperti sebelumnya)"""
+        angle = self.quantize_angle(angle)
+        if not flip_horizontal and not flip_vertical and angle == 0:
+            return frame
+
+        key = (frame, bool(flip_horizontal), bool(flip_vertical), angle)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = frame
+        if flip_horizontal or flip_vertical:
+            surface = pygame.transform.flip(surface, flip_horizontal, flip_vertical)
+        if angle != 0:
+            surface = pygame.transform.rotate(surface, angle)
+        self._store(key, surface)
+        return surface
+
+    def _store(self, key, surface):
+        size = self._surface_bytes(surface)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = surface
+        self.current_bytes += size
+        # Buang entry yang paling lama tidak dipakai sampai muat lagi
+        while self.current_bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.current_bytes -= self._surface_bytes(old)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def stats(self):
+        """Statistik cache untuk debugging"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Satu instance untuk seluruh proses
+transform_cache = TransformCache()
@@ -0,0 +1,34 @@
+import numpy as np
+import pygame
+
+
+class WalkabilityGrid:
+    """Grid boolean hasil bake dari bg_mask, dipakai untuk cek walkable tanpa Surface.get_at"""
+    def __init__(self, grid):
+        # grid[y, x] -> True jika walkable
+        self.grid = np.ascontiguousarray(grid, dtype=bool)
+        self.height, self.width = self.grid.shape
+
+    @classmethod
+    def from_surface(cls, mask_surface):
+        """Bake mask sekali: field merah (R > 200, G < 80, B < 80) dianggap walkable"""
+        rgb = pygame.surfarray.array3d(mask_surface)  # shape (w, h, 3)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        walkable = (r > 200) & (g < 80) & (b < 80)
+        return cls(walkable.T)
+
+    def is_walkable(self, x, y):
+        xi = int(x)
+        yi = int(y)
+        if 0 <= xi < self.width and 0 <= yi < self.height:
+            return bool(self.grid[yi, xi])
+        return False
+
+    def is_walkable_many(self, xs, ys):
+        """Versi batch dari is_walkable untuk array posisi (N,)"""
+        xi = np.asarray(xs).astype(np.intp)
+        yi = np.asarray(ys).astype(np.intp)
+        inside = (xi >= 0) & (xi < self.width) & (yi >= 0) & (yi < self.height)
+        result = np.zeros(inside.shape, dtype=bool)
+        result[inside] = self.grid[yi[inside], xi[inside]]
+        return result
@@ -1,31 +1,66 @@
 import numpy as np
 
+def _delta(a, b, wrap_width=None):
+    """Selisih a - b, opsional X lewat jalur terpendek pada dunia yang wrap-around"""
+    delta = np.asarray(a, dtype=float) - np.asarray(b, dtype=float)
+    if wrap_width:
+        delta[..., 0] -= np.round(delta[..., 0] / wrap_width) * wrap_width
+    return delta
+
 def circle_collision(pos1, radius1, pos2, radius2):
     """Deteksi tabrakan antara dua lingkaran"""
-    distance = np.linalg.norm(pos1 - pos2)
-    return distance < (radius1 + radius2)
+    delta = _delta(pos1, pos2)
+    reach = radius1 + radius2
+    return float(np.dot(delta, delta)) < reach * reach
+
+def circles_collision(pos, radius, positions, radii, wrap_width=None):
+    """Satu lingkaran vs banyak lingkaran (N,2), return array bool (N,)"""
+    delta = _delta(positions, pos, wrap_width)
+    reach = np.asarray(radii) + radius
+    return np.einsum('ij,ij->i', delta, delta) < reach * reach
+
+def circle_pairs_collision(pos_a, radii_a, pos_b, radii_b, wrap_width=None):
+    """Cek pasangan lingkaran ke-i dari a dan b (sama-sama (N,2)), return array bool (N,)"""
+    delta = _delta(pos_a, pos_b, wrap_width)
+    reach = np.asarray(radii_a) + np.asarray(radii_b)
+    return np.einsum('ij,ij->i', delta, delta) < reach * reach
+
+def circles_all_pairs_collision(pos_a, radii_a, pos_b, radii_b, wrap_width=None):
+    """Semua pasangan a (N,2) vs b (M,2), return matriks bool (N, M)"""
+    pos_a = np.asarray(pos_a, dtype=float)
+    pos_b = np.asarray(pos_b, dtype=float)
+    delta = _delta(pos_a[:, None, :], pos_b[None, :, :], wrap_width)
+    radii_a = np.broadcast_to(np.asarray(radii_a, dtype=float), (len(pos_a),))
+    radii_b = np.broadcast_to(np.asarray(radii_b, dtype=float), (len(pos_b),))
+    reach = radii_a[:, None] + radii_b[None, :]
+    return np.einsum('ijk,ijk->ij', delta, delta) < reach * reach
+
+class Polygon:
+    """Polygon dengan vektor unit tiap edge yang dihitung sekali saja"""
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=float)
+        edges = np.roll(self.points, -1, axis=0) - self.points
+        self.lengths = np.hypot(edges[:, 0], edges[:, 1])
+        safe_lengths = np.where(self.lengths > 0, self.lengths, 1.0)
+        self.unit_edges = edges / safe_lengths[:, None]
+
+    def distance_sq(self, centers):
+        """Jarak kuadrat terdekat dari tiap titik (N,2) ke edge polygon"""
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        # Proyeksi titik ke garis, shape (N, E)
+        point_vec = centers[:, None, :] - self.points[None, :, :]
+        projection = np.einsum('nek,ek->ne', point_vec, self.unit_edges)
+        projection = np.clip(projection, 0, self.lengths)
+        nearest = self.points[None, :, :] + projection[..., None] * self.unit_edges[None, :, :]
+        diff = nearest - centers[:, None, :]
+        return np.einsum('nek,nek->ne', diff, diff).min(axis=1)
 
 def polygon_circle_collision(poly_points, circle_pos, circle_radius):
     """Deteksi tabrakan antara polygon dan lingkaran"""
-    closest_point = None
-    min_distance = float('inf')
-    
-    for i in range(len(poly_points)):
-        start = poly_points[i]
-        end = poly_points[(i + 1) % len(poly_points)]
-        
-        # Proyeksi titik ke garis
-        line_vec = end - start
-        point_vec = circle_pos - start
-        line_length = np.linalg.norm(line_vec)
-        line_unit_vec = line_vec / line_length
-        projection = np.dot(point_vec, line_unit_vec)
-        projection = np.clip(projection, 0, line_length)
-        nearest = start + projection * line_unit_vec
-        
-        distance = np.linalg.norm(nearest - circle_pos)
-        if distance < min_distance:
-            min_distance = distance
-            closest_point = nearest
-    
-    return min_distance < circle_radius
\ No newline at end of file
+    polygon = poly_points if isinstance(poly_points, Polygon) else Polygon(poly_points)
+    return bool(polygon.distance_sq(circle_pos)[0] < circle_radius * circle_radius)
+
+def polygon_circles_collision(polygon, centers, radii):
+    """Satu polygon vs banyak lingkaran (N,2), return array bool (N,)"""
+    radii = np.asarray(radii, dtype=float)
+    return polygon.distance_sq(centers) < radii * radii
@@ -6,6 +6,20 @@ def normalize_vector(vector):
         return vector
     return vector / norm
 
+def lerp_wrapped(prev, current, alpha, wrap_width=None):
+    """Interpolasi posisi (N,2) antara dua tick, X lewat jalur terpendek jika dunia wrap"""
+    delta = current - prev
+    if wrap_width:
+        delta[..., 0] -= np.round(delta[..., 0] / wrap_width) * wrap_width
+    result = prev + delta * alpha
+    if wrap_width:
+        result[..., 0] %= wrap_width
+    return result
+
+def wrap_near(values, center, period):
+    """Geser koordinat yang wrap (mis. X dunia) ke salinan yang paling dekat dengan center"""
+    return (values - center + period / 2) % period + center - period / 2
+
 def get_rotation_matrix(angle):
     return np.array([
         [np.cos(angle), -np.sin(angle)],
@@ -0,0 +1,42 @@
+import os
+import sys
+from pathlib import Path
+
+import pygame
+import pytest
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+GAME_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(GAME_DIR))
+
+
+def post_key(key):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+
+def test_run_from_menu_into_play(monkeypatch):
+    # Path asset di game relatif ke folder project ("Game/assets/...")
+    monkeypatch.chdir(GAME_DIR.parent)
+    from main import Game
+    game = Game(headless=True, seed=0)
+    monkeypatch.setattr(game, 'save_high_score', lambda: None)
+    assert game.current_state is game.states['menu']
+
+    # Beberapa tick di menu (belum ada player), Enter ke play state, beberapa tick lagi lalu quit
+    ticks = {'count': 0}
+    begin_sim_step = game.begin_sim_step
+
+    def counting_step():
+        begin_sim_step()
+        ticks['count'] += 1
+        if ticks['count'] == 5:
+            post_key(pygame.K_RETURN)
+        elif ticks['count'] == 15:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+    monkeypatch.setattr(game, 'begin_sim_step', counting_step)
+
+    with pytest.raises(SystemExit):
+        game.run()
+    assert ticks['count'] >= 15
+    assert game.current_state is game.states['play']
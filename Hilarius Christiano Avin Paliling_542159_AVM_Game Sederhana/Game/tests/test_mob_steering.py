@@ -0,0 +1,44 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+GAME_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(GAME_DIR))
+
+
+@pytest.fixture
+def game(monkeypatch):
+    # Path asset di game relatif ke folder project ("Game/assets/...")
+    monkeypatch.chdir(GAME_DIR.parent)
+    from main import Game
+    game = Game(headless=True, seed=0)
+    game.change_state('play')
+    return game
+
+
+def place_overlapping_pair(game):
+    """Dua mob hampir bertumpuk sedikit di bawah player, return jarak awal keduanya"""
+    x, y = game.player.pos[0], game.player.pos[1] + 60
+    for mob_x in (x, x + 3):
+        assert game.is_walkable(mob_x, y)
+    game.mobs.clear()
+    game.mobs.spawn(x, y)
+    game.mobs.spawn(x + 3, y)
+    game.flow_field.set_target(*game.player.pos)
+    return np.hypot(*(game.mobs.pos[1] - game.mobs.pos[0]))
+
+
+@pytest.mark.parametrize('flip_horizontal, flip_vertical',
+                         [(False, False), (True, False), (False, True), (True, True)])
+def test_overlapping_mobs_separate_when_flipped(game, flip_horizontal, flip_vertical):
+    game.player.flip_horizontal = flip_horizontal
+    game.player.flip_vertical = flip_vertical
+    before = place_overlapping_pair(game)
+    game.mobs.update()
+    after = np.hypot(*(game.mobs.pos[1] - game.mobs.pos[0]))
+    assert after > before